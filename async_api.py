@@ -0,0 +1,254 @@
+"""Asyncio counterparts of SubdlAPI and TMDBApi.
+
+Requires httpx (pip install "httpx[http2]"). HTTP/2 is used when the h2
+package is installed, so many requests share a single connection.
+
+Headless use:
+
+    async def main():
+        async with AsyncSubdlAPI() as subdl:
+            await subdl.upload_subtitle(...)
+
+    asyncio.run(main())
+
+From the Qt GUI, start an AsyncLoopThread once and submit coroutines to it.
+The returned concurrent.futures.Future can emit a pyqtSignal from its done
+callback, which Qt delivers on the GUI thread.
+"""
+import asyncio
+import importlib.util
+import threading
+import traceback
+from pathlib import Path
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from request_scheduler import UNPROCESSED_STATUS
+from subdl_api import SubdlAPI
+from tmdb_api import TMDBApi
+
+
+def _create_client(pool_size, timeout, headers=None):
+    """Create an httpx client, using HTTP/2 when h2 is available"""
+    if httpx is None:
+        raise ImportError('The async clients require httpx: pip install "httpx[http2]"')
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec('h2') is not None,
+        limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+        headers=headers
+    )
+
+
+class AsyncSubdlAPI(SubdlAPI):
+    """SubdlAPI with the network methods as coroutines"""
+
+    def _create_session(self):
+        return _create_client(self.pool_size, self.timeout)
+
+    @property
+    def retry_errors(self):
+        return (httpx.TransportError,)
+
+    @property
+    def retry_errors_unsafe(self):
+        return (httpx.ConnectError, httpx.ConnectTimeout)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled connections"""
+        await self.session.aclose()
+
+    async def get_nid(self):
+        """Get a unique ID from subdl API"""
+        headers = {'token': self.token}
+        response = await self.scheduler.acall(
+            'nid',
+            lambda: self.session.get(f'{self.BASE_URL}/user/getNId', headers=headers),
+            self.retry_errors
+        )
+        if response.is_success:
+            data = response.json()
+            if data.get('ok'):
+                return data.get('n_id')
+        self._report(f"Failed to get NID from subdl: {response.text}")
+        return None
+
+    async def upload_subtitle_file(self, subtitle_file, on_progress=None, content=None):
+        """Upload a subtitle file to subdl, or the given bytes under its name.
+
+        The body is sent in one piece, so on_progress(sent_bytes, total_bytes)
+        is only called once it has been sent.
+        """
+        headers = {'token': self.token}
+        if content is None:
+            content = await asyncio.to_thread(Path(subtitle_file).read_bytes)
+        files = {'subtitle': (Path(subtitle_file).name, content)}
+        response = await self.scheduler.acall('upload', lambda: self.session.post(
+            f'{self.BASE_URL}/user/uploadSingleSubtitle',
+            headers=headers,
+            files=files
+        ), self.retry_errors)
+        if on_progress:
+            on_progress(len(content), len(content))
+        if response.is_success:
+            data = response.json()
+            if data.get('ok'):
+                return data.get('file', {}).get('file_n_id')
+        self._report(f"Failed to upload subtitle file to subdl: {response.text}")
+        return None
+
+    async def complete_upload(self, upload_data):
+        """Complete the subtitle upload process"""
+        form_data = self.build_form_data(upload_data)
+        if form_data is None:
+            return False
+
+        try:
+            response = await self.scheduler.acall('complete', lambda: self.session.post(
+                f'{self.BASE_URL}/user/uploadSubtitle',
+                headers={'token': self.token},
+                data=form_data
+            ), self.retry_errors_unsafe, UNPROCESSED_STATUS)
+            response.raise_for_status()
+            return self.parse_complete_response(response.json())
+        except (httpx.HTTPError, ValueError) as e:
+            self._report(f"Failed to complete subtitle upload to subdl: {str(e)}")
+            self._report(f"SUBDL Debug - Error Details: {traceback.format_exc()}")
+            return False
+
+    async def upload_subtitle(self, subtitle_file, tmdb_id, season, releases, language_id,
+                              comment="", framerate="23.976", episode_from=None, episode_to=None):
+        """Upload subtitle with specific language code"""
+        if language_id not in self.LANGUAGES:
+            self._report(f"Invalid language code: {language_id}")
+            return False
+
+        try:
+            if not self.token:
+                raise Exception('Missing subdl token in database')
+
+            # The n_id and the file upload do not depend on each other
+            n_id, file_n_id = await asyncio.gather(
+                self.get_nid(),
+                self.upload_subtitle_file(subtitle_file)
+            )
+            if not n_id:
+                raise Exception('Failed to get NID')
+            if not file_n_id:
+                raise Exception('Failed to upload subtitle file')
+
+            upload_data = self.build_upload_data(
+                subtitle_file, file_n_id, n_id, tmdb_id, season,
+                releases, language_id, comment, framerate
+            )
+            if not await self.complete_upload(upload_data):
+                raise Exception('Failed to complete subtitle upload')
+
+            self._report(f"SUBDL: Successfully uploaded subtitle {Path(subtitle_file).name}")
+            return True
+
+        except Exception as e:
+            self._report(f"SUBDL: Upload failed - {str(e)}")
+            return False
+
+
+class AsyncTMDBApi(TMDBApi):
+    """TMDBApi with the network methods as coroutines"""
+
+    def __init__(self, api_key, cache=None, pool_size=10, timeout=(10, 30)):
+        # The requests session of TMDBApi is not needed here
+        self.api_key = api_key
+        self.base_url = "https://api.themoviedb.org/3"
+        self.headers = {
+            "accept": "application/json",
+            "Authorization": f"Bearer {api_key}"
+        }
+        self.cache = cache
+        self.timeout = timeout
+        self.session = _create_client(pool_size, timeout, self.headers)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        await self.session.aclose()
+
+    async def _get(self, endpoint, path, params=None):
+        """GET a TMDB endpoint through the response cache, see TMDBApi._get"""
+        key = self._cache_key(path, params)
+        cached = self.cache.get(key) if self.cache else None
+        if cached and cached[2] < self.CACHE_TTL[endpoint]:
+            return cached[0]
+
+        headers = {'If-None-Match': cached[1]} if cached and cached[1] else None
+        try:
+            response = await self.session.get(f"{self.base_url}/{path}", headers=headers, params=params)
+            if response.status_code == 304 and cached:
+                self.cache.refresh(key)
+                return cached[0]
+            response.raise_for_status()
+        except httpx.HTTPError:
+            if cached:
+                return cached[0]
+            raise
+
+        data = response.json()
+        if self.cache:
+            self.cache.put(key, data, response.headers.get('ETag'))
+        return data
+
+    async def search_tv_series(self, query):
+        """Search for TV series and return results"""
+        return (await self.search_tv_series_page(query))['results']
+
+    async def search_tv_series_page(self, query, page=1):
+        """Search for TV series and return one page of results"""
+        params = {
+            'query': query,
+            'include_adult': False,
+            'language': 'en-US',
+            'page': page
+        }
+
+        try:
+            return self._search_page(await self._get('search/tv', 'search/tv', params), page)
+        except Exception as e:
+            print(f"TMDB API Error: {str(e)}")
+            return {'results': [], 'page': page, 'total_pages': 0, 'total_results': 0, 'failed': True}
+
+    async def get_tv_details(self, tmdb_id):
+        """Get detailed information about a TV series"""
+        try:
+            return await self._get('tv', f"tv/{tmdb_id}")
+        except Exception as e:
+            print(f"TMDB API Error: {str(e)}")
+            return {}
+
+
+class AsyncLoopThread:
+    """Runs one asyncio event loop on a daemon thread for GUI code"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='asyncio', daemon=True)
+        self.thread.start()
+
+    def submit(self, coro):
+        """Schedule a coroutine and return a concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
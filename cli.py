@@ -0,0 +1,229 @@
+"""Headless command line uploader.
+
+Never imports Qt, so it runs on machines without a display:
+
+    python cli.py upload DIR --tmdb-id 1399 --lang AR
+    python cli.py upload DIR --lang AR      # series looked up on TMDB
+    python cli.py search "Game of Thrones"
+
+Defaults (language, framerate, comment, release templates, concurrency) are
+read from settings.json, the same file the GUI writes.
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+
+from subdl_api import SubdlAPI
+from subtitle_validator import validate_subtitle
+from subtitle_encoding import DEFAULT_LEGACY_ENCODING
+from subtitle_files import (find_subtitle_files, parse_subtitle_filename, process_release_templates,
+                            FAST_PATH_STATS, EXCLUDED_DIRS)
+
+
+def load_settings():
+    try:
+        with open('settings.json', 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def create_tmdb(settings):
+    """TMDB client sharing the GUI's response cache"""
+    from tmdb_api import TMDBApi
+    from tmdb_cache import ResponseCache
+
+    return TMDBApi(settings.get('tmdb_api_key', ''), ResponseCache())
+
+
+def resolve_series(parsed, settings):
+    """Resolve every detected title to a TMDB id, {series: tmdb_id} for confident matches"""
+    from series_resolver import SeriesResolver
+
+    tmdb = create_tmdb(settings)
+    resolver = SeriesResolver(tmdb)
+    titles = {file_info['title'] for _, file_info in parsed if file_info}
+    tmdb_ids = {}
+    def report_error(title, error):
+        print(f"Skipping series \"{title}\": {error}, try again later or pass --tmdb-id")
+
+    try:
+        matches = resolver.resolve_many(titles, on_error=report_error)
+    finally:
+        tmdb.cache.close()
+    for title, match in matches.items():
+        if not match or match['confidence'] < resolver.CONFIDENT:
+            found = f"best match {match['name']} ({match['tmdb_id']})" if match else "no match"
+            print(f"Skipping series \"{title}\": {found}, pass --tmdb-id to upload it")
+            continue
+        print(f"Series \"{title}\": {match['name']} ({match['tmdb_id']})")
+        tmdb_ids[title.lower()] = match['tmdb_id']
+    return tmdb_ids
+
+
+def build_jobs(files, args, settings):
+    """Parse every file and turn it into an UploadPipeline job"""
+    templates = args.release_template or settings.get('releases_template', [])
+    parsed = [(file_path, parse_subtitle_filename(file_path)[1]) for file_path in files]
+    # Without --tmdb-id each title group goes to its own series
+    tmdb_ids = None if args.tmdb_id else resolve_series(parsed, settings)
+    jobs = []
+    for file_path, file_info in parsed:
+        season = args.season or (file_info or {}).get('season')
+        episode = (file_info or {}).get('episode')
+        if not season or not episode or not season.isdigit() or not episode.isdigit():
+            print(f"Skipping {os.path.basename(file_path)}: no season/episode detected")
+            continue
+        tmdb_id = args.tmdb_id or tmdb_ids.get(file_info['title'].lower())
+        if not tmdb_id:
+            continue
+        if problem := validate_subtitle(file_path):
+            print(f"Skipping {os.path.basename(file_path)}: {problem}")
+            continue
+
+        jobs.append({
+            'file_path': file_path,
+            'tmdb_id': tmdb_id,
+            'season': season,
+            'releases': process_release_templates(templates, season, episode, os.path.basename(file_path)),
+            'language': args.lang,
+            'comment': args.comment,
+            'framerate': SubdlAPI.FRAMERATE_MAP[args.framerate],
+            'episode': episode
+        })
+    return jobs
+
+
+def upload(args, settings):
+    from scan_index import ScanIndex
+
+    if args.lang not in SubdlAPI.LANGUAGES:
+        print(f"Unknown language code: {args.lang}")
+        return 2
+
+    scan_index = ScanIndex() if args.incremental else None
+    try:
+        return upload_files(args, settings, scan_index)
+    finally:
+        if scan_index:
+            scan_index.close()
+
+
+def upload_files(args, settings, scan_index=None):
+    """Scan, parse and upload, files that are not uploaded stay new for the next incremental scan"""
+    from upload_pipeline import UploadPipeline
+    from upload_journal import UploadJournal
+    from dedup_index import DedupIndex
+
+    files = find_subtitle_files(args.paths, settings.get('scan_exclude', EXCLUDED_DIRS), scan_index)
+    jobs = build_jobs(files, args, settings)
+    if args.verbose:
+        print(f"Parsed filenames, {FAST_PATH_STATS}")
+    if not jobs:
+        print("No subtitle files to upload")
+        return 1
+    print(f"Uploading {len(jobs)} file(s) in {args.lang}")
+
+    # First Ctrl+C stops scheduling new files, a second one aborts
+    cancelled = threading.Event()
+
+    def handle_interrupt(signum, frame):
+        if cancelled.is_set():
+            raise KeyboardInterrupt
+        print("Cancelling, waiting for uploads in flight (Ctrl+C again to abort)")
+        cancelled.set()
+    signal.signal(signal.SIGINT, handle_interrupt)
+
+    def report(index, state, message):
+        if state == 'processing':
+            return
+        if state == 'uploading' and not args.verbose:
+            return
+        if scan_index and state in ('completed', 'skipped'):
+            scan_index.mark_done([jobs[index]['file_path']])
+        name = os.path.basename(jobs[index]['file_path'])
+        print(f"[{index + 1}/{len(jobs)}] {name}: {state}{f' - {message}' if message else ''}")
+
+    subdl = SubdlAPI()
+    journal = UploadJournal()
+    dedup = DedupIndex()
+    # Season packs are checked against TMDB's episode counts
+    tmdb = create_tmdb(settings) if args.season_packs else None
+    try:
+        pipeline = UploadPipeline(
+            subdl, args.workers, journal=journal, dedup=dedup,
+            skip_duplicates=settings.get('skip_duplicates', True) and not args.no_skip_duplicates,
+            season_packs=args.season_packs, normalize_encoding=args.normalize_encoding,
+            legacy_encoding=settings.get('legacy_encoding', DEFAULT_LEGACY_ENCODING), tmdb=tmdb
+        )
+        success = pipeline.run(jobs, report, is_cancelled=cancelled.is_set)
+    finally:
+        subdl.close()
+        journal.close()
+        dedup.close()
+        if tmdb:
+            tmdb.close()
+            tmdb.cache.close()
+
+    print("All subtitles uploaded successfully!" if success else "Some files failed to upload.")
+    return 0 if success else 1
+
+
+def search(args, settings):
+    tmdb = create_tmdb(settings)
+    try:
+        for show in tmdb.search_tv_series(args.query):
+            year = show.get('first_air_date', '')[:4]
+            print(f"{show.get('id')}\t{show.get('name')}{f' ({year})' if year else ''}")
+    finally:
+        tmdb.cache.close()
+    return 0
+
+
+def main(argv=None):
+    settings = load_settings()
+
+    parser = argparse.ArgumentParser(prog='cli.py', description='Upload subtitles to Subdl without the GUI')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    upload_parser = commands.add_parser('upload', help='Upload subtitle files or folders')
+    upload_parser.add_argument('paths', nargs='+', help='Subtitle files or folders to scan')
+    upload_parser.add_argument('--tmdb-id',
+                               help='TMDB ID of the series, found from the filenames if omitted')
+    upload_parser.add_argument('--lang', default=settings.get('default_language', 'EN'),
+                               type=str.upper, help='Subdl language code, e.g. AR')
+    upload_parser.add_argument('--season', help='Override the detected season number')
+    upload_parser.add_argument('--comment', default=settings.get('default_comment', ''))
+    upload_parser.add_argument('--framerate', default=settings.get('default_framerate', '23.976'),
+                               choices=list(SubdlAPI.FRAMERATE_MAP))
+    upload_parser.add_argument('--release-template', action='append',
+                               help='Release name template with S00E00, may be repeated')
+    upload_parser.add_argument('--workers', type=int, default=settings.get('upload_workers', 4),
+                               help='Number of subtitles uploaded at the same time')
+    upload_parser.add_argument('--season-packs', action='store_true',
+                               default=settings.get('season_packs', False),
+                               help='Submit each complete season as a single full-season upload')
+    upload_parser.add_argument('--normalize-encoding', action='store_true',
+                               default=settings.get('normalize_encoding', False),
+                               help='Convert cp1256 and UTF-16 subtitles to UTF-8 before uploading')
+    upload_parser.add_argument('--incremental', action='store_true',
+                               default=settings.get('incremental_scan', False),
+                               help='Only upload files that are new or changed since the last scan')
+    upload_parser.add_argument('--no-skip-duplicates', action='store_true',
+                               help='Upload files even if their content was uploaded before')
+    upload_parser.add_argument('-v', '--verbose', action='store_true', help='Show upload progress')
+    upload_parser.set_defaults(handler=upload)
+
+    search_parser = commands.add_parser('search', help='Search TMDB for a TV series ID')
+    search_parser.add_argument('query')
+    search_parser.set_defaults(handler=search)
+
+    args = parser.parse_args(argv)
+    return args.handler(args, settings)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
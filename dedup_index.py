@@ -0,0 +1,93 @@
+import hashlib
+import os
+from datetime import datetime
+
+from sqlite_store import SQLiteStore
+
+
+class DedupIndex(SQLiteStore):
+    """Persistent index of uploaded subtitle content hashes.
+
+    Maps a BLAKE2b digest of the file bytes to where it was uploaded, so
+    byte-identical subtitles are recognised after renames, moves and
+    restarts. Digests are cached by (path, size, mtime) so unchanged files
+    are not read again. Both lookups hit a primary key index, which keeps
+    them fast with hundreds of thousands of entries.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, path='dedup_index.db'):
+        super().__init__(path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS uploads (
+                digest TEXT NOT NULL,
+                tmdb_id TEXT NOT NULL,
+                season TEXT NOT NULL,
+                language TEXT NOT NULL,
+                uploaded_at TEXT NOT NULL,
+                PRIMARY KEY (digest, tmdb_id, season, language)
+            ) WITHOUT ROWID
+        """)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS file_hashes (
+                file_path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.db.commit()
+
+    def file_hash(self, file_path):
+        """Return the hex BLAKE2b digest of a file, reusing the cached one if unchanged"""
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        with self.lock:
+            row = self.db.execute(
+                'SELECT size, mtime_ns, digest FROM file_hashes WHERE file_path = ?',
+                (file_path,)
+            ).fetchone()
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            while chunk := f.read(self.CHUNK_SIZE):
+                digest.update(chunk)
+        digest = digest.hexdigest()
+
+        with self.lock, self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO file_hashes (file_path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)',
+                (file_path, stat.st_size, stat.st_mtime_ns, digest)
+            )
+        return digest
+
+    def lookup(self, digest):
+        """Return the first recorded upload of a digest, or None"""
+        with self.lock:
+            row = self.db.execute(
+                'SELECT tmdb_id, season, language, uploaded_at FROM uploads WHERE digest = ? LIMIT 1',
+                (digest,)
+            ).fetchone()
+        if not row:
+            return None
+        return {'tmdb_id': row[0], 'season': row[1], 'language': row[2], 'date': row[3]}
+
+    def is_uploaded(self, file_path):
+        """Return the recorded upload of a file's content, or None"""
+        try:
+            return self.lookup(self.file_hash(file_path))
+        except OSError:
+            return None
+
+    def record(self, digest, tmdb_id, season, language):
+        """Remember that content with this digest was uploaded"""
+        with self.lock, self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO uploads (digest, tmdb_id, season, language, uploaded_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (digest, str(tmdb_id), str(season), language,
+                 datetime.now().isoformat(timespec='seconds'))
+            )
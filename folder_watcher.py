@@ -0,0 +1,152 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from scan_index import ScanIndex
+from subtitle_files import EXCLUDED_DIRS, scan_subtitle_files
+
+
+class FolderWatcher(QObject):
+    """Watch drop folders and report subtitle files once their writes settle.
+
+    Change notifications come from QFileSystemWatcher (inotify on Linux).
+    Folders it cannot watch, or every folder when polling is requested, are
+    rescanned on a timer instead. Both paths run the same incremental scan
+    against an in-memory ScanIndex, off the GUI thread, so only changed
+    directories are listed. New or modified files are reported through
+    files_ready once their size and mtime stayed the same for SETTLE_SECONDS.
+    Files already present when watching starts are not reported.
+    """
+
+    files_ready = pyqtSignal(list)
+    # Emitted from the scan thread, delivered on the GUI thread
+    scan_finished = pyqtSignal(list, list)
+
+    SETTLE_SECONDS = 2.0
+    POLL_SECONDS = 10.0
+    # Bursts of change notifications are folded into one scan
+    DEBOUNCE_MS = 300
+
+    def __init__(self, folders, excluded=EXCLUDED_DIRS, polling=False, parent=None):
+        super().__init__(parent)
+        self.folders = [os.path.abspath(folder) for folder in folders]
+        self.excluded = excluded
+        self.index = ScanIndex(':memory:')
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending = {}  # path -> (size, mtime_ns, unchanged since)
+        self.scanning = False
+        self.rescan = False
+        self.baseline = True
+        self.stopped = False
+
+        self.watcher = None if polling else QFileSystemWatcher(self)
+        if self.watcher:
+            self.watcher.directoryChanged.connect(self.request_scan)
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.start_scan)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(int(self.POLL_SECONDS * 1000))
+        self.poll_timer.timeout.connect(self.start_scan)
+        if polling:
+            self.poll_timer.start()
+
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setInterval(500)
+        self.settle_timer.timeout.connect(self.check_pending)
+
+        self.scan_finished.connect(self.handle_scan_finished)
+
+    def start(self):
+        """Record what the folders hold now, later changes are reported"""
+        self.start_scan()
+
+    def stop(self):
+        self.stopped = True
+        self.debounce_timer.stop()
+        self.poll_timer.stop()
+        self.settle_timer.stop()
+        if self.watcher and self.watcher.directories():
+            self.watcher.removePaths(self.watcher.directories())
+        # A running scan sees stopped and returns early, the index is closed
+        # on the scan thread after it, without blocking the GUI thread
+        self.executor.submit(self.index.close)
+        self.executor.shutdown(wait=False)
+
+    def request_scan(self, *args):
+        self.debounce_timer.start()
+
+    def start_scan(self):
+        if self.stopped:
+            return
+        if self.scanning:
+            # Changes during a scan may have been missed, look again afterwards
+            self.rescan = True
+            return
+        self.scanning = True
+        self.executor.submit(self.scan)
+
+    def scan(self):
+        """Runs on the scan thread: list changed directories and emit what is new"""
+        files = []
+        try:
+            files = list(scan_subtitle_files(
+                self.folders, self.excluded, lambda: self.stopped, self.index
+            ))
+            # The watcher reports each change once, whether or not it gets uploaded
+            self.index.mark_done(files)
+            directories = self.index.directories() if self.watcher else []
+        except Exception:
+            directories = []
+        self.scan_finished.emit(files, directories)
+
+    def handle_scan_finished(self, files, directories):
+        self.scanning = False
+        if self.stopped:
+            return
+        if self.watcher:
+            watched = set(self.watcher.directories())
+            new = [d for d in directories if d not in watched]
+            # Folders that cannot be watched (e.g. watch limit reached) fall back to polling
+            if new and self.watcher.addPaths(new) and not self.poll_timer.isActive():
+                self.poll_timer.start()
+
+        if self.baseline:
+            self.baseline = False
+        else:
+            now = time.monotonic()
+            for file_path in files:
+                self.pending.setdefault(file_path, (None, None, now))
+            if self.pending and not self.settle_timer.isActive():
+                self.settle_timer.start()
+
+        if self.rescan:
+            self.rescan = False
+            self.start_scan()
+
+    def check_pending(self):
+        """Report the pending files that stopped changing"""
+        now = time.monotonic()
+        ready = []
+        for file_path, (size, mtime_ns, since) in list(self.pending.items()):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                # Deleted or renamed before it settled
+                del self.pending[file_path]
+                continue
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                self.pending[file_path] = (stat.st_size, stat.st_mtime_ns, now)
+            elif now - since >= self.SETTLE_SECONDS:
+                del self.pending[file_path]
+                ready.append(file_path)
+
+        if not self.pending:
+            self.settle_timer.stop()
+        if ready:
+            self.files_ready.emit(ready)
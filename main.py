@@ -1,6 +1,7 @@
 import sys
 import os
 import logging
+import multiprocessing
 import traceback
 from datetime import datetime
 from PyQt6.QtWidgets import QApplication, QMessageBox
@@ -82,4 +83,6 @@ def main():
         sys.exit(1)
 
 if __name__ == '__main__':
+    # Filename parsing runs on a process pool, which frozen builds need this for
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
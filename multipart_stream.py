@@ -0,0 +1,95 @@
+import mmap
+import os
+import time
+import uuid
+
+
+class MultipartFileStream:
+    """File-like multipart/form-data body that streams one file from a memory map.
+
+    requests reads the body in small blocks instead of building it in memory,
+    and knows the Content-Length from __len__. on_progress(sent, total) is
+    called while the body is read, at most every progress_interval seconds
+    and once at the end. When content is given, those bytes are sent under
+    the file's name instead of the file on disk.
+    """
+
+    def __init__(self, field_name, file_path, on_progress=None, progress_interval=0.25, content=None):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.last_progress = 0.0
+
+        filename = os.path.basename(file_path).replace('"', '%22')
+        head = (
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n'
+        ).encode('utf-8')
+        tail = f'\r\n--{self.boundary}--\r\n'.encode('ascii')
+
+        self.file = None
+        self.map = None
+        if content is not None:
+            body = memoryview(content)
+        else:
+            self.file = open(file_path, 'rb')
+            size = os.fstat(self.file.fileno()).st_size
+            # Empty files cannot be memory-mapped
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            body = memoryview(self.map) if self.map else memoryview(b'')
+
+        self.parts = [memoryview(head), body, memoryview(tail)]
+        self.length = sum(len(part) for part in self.parts)
+        self.part = 0
+        self.offset = 0
+        self.sent = 0
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+        """Return the next block of the encoded body"""
+        if size is None or size < 0:
+            size = self.length - self.sent
+
+        chunks = []
+        while size > 0 and self.part < len(self.parts):
+            part = self.parts[self.part]
+            chunk = part[self.offset:self.offset + size]
+            chunks.append(bytes(chunk))
+            size -= len(chunk)
+            self.offset += len(chunk)
+            if self.offset >= len(part):
+                self.part += 1
+                self.offset = 0
+
+        data = b''.join(chunks)
+        if data:
+            self.sent += len(data)
+            self._report_progress()
+        return data
+
+    def _report_progress(self):
+        if not self.on_progress:
+            return
+        now = time.monotonic()
+        if self.sent >= self.length or now - self.last_progress >= self.progress_interval:
+            self.last_progress = now
+            self.on_progress(self.sent, self.length)
+
+    def close(self):
+        # Views must be released before the map can close
+        for part in self.parts:
+            part.release()
+        if self.map:
+            self.map.close()
+        if self.file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,75 @@
+import json
+import time
+from importlib import metadata
+
+from sqlite_store import LRUStore
+
+
+def guessit_version():
+    """Installed guessit version, read without importing guessit"""
+    try:
+        return metadata.version('guessit')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+class ParseCache(LRUStore):
+    """On-disk LRU cache of parsed filenames.
+
+    Maps a filename to the season/episode/title dict extracted by guessit.
+    Holds at most max_entries rows, evicting the least recently used ones,
+    and is emptied when the installed guessit version changes.
+    """
+
+    def __init__(self, path='parse_cache.db', max_entries=200000):
+        super().__init__(path, 'parsed', 'filename', max_entries)
+        self.db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS parsed (
+                filename TEXT PRIMARY KEY,
+                info TEXT NOT NULL,
+                used_at REAL NOT NULL
+            )
+        """)
+        self._create_used_at_index()
+        self._check_version()
+        self.db.commit()
+
+    def _check_version(self):
+        """Drop every entry parsed by a different guessit version"""
+        version = guessit_version()
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'guessit_version'").fetchone()
+        if not row or row[0] != version:
+            self.db.execute('DELETE FROM parsed')
+            self.db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('guessit_version', ?)",
+                (version,)
+            )
+
+    def get_many(self, filenames):
+        """Return {filename: info} for the filenames that are cached"""
+        found = {}
+        filenames = list(dict.fromkeys(filenames))
+        with self.lock, self.db:
+            # Stay under SQLite's bound parameter limit
+            for i in range(0, len(filenames), 500):
+                chunk = filenames[i:i + 500]
+                marks = ','.join('?' * len(chunk))
+                for filename, info in self.db.execute(
+                    f'SELECT filename, info FROM parsed WHERE filename IN ({marks})', chunk
+                ):
+                    found[filename] = json.loads(info)
+                self._touch(chunk)
+        return found
+
+    def put_many(self, entries):
+        """Store {filename: info} and evict the oldest rows over the size limit"""
+        if not entries:
+            return
+        now = time.time()
+        with self.lock, self.db:
+            self.db.executemany(
+                'INSERT OR REPLACE INTO parsed (filename, info, used_at) VALUES (?, ?, ?)',
+                [(filename, json.dumps(info), now) for filename, info in entries.items()]
+            )
+            self._evict()
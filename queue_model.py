@@ -0,0 +1,238 @@
+import os
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+from series_resolver import SeriesResolver
+
+
+def needs_review(match):
+    """A lookup that found no series or only a doubtful one"""
+    return not match or match['confidence'] < SeriesResolver.CONFIDENT
+
+
+def path_key(path):
+    """Identity of a file on disk, the same through symlinks and relative paths"""
+    return os.path.normcase(os.path.realpath(path))
+
+
+class QueueRecord:
+    """One queued subtitle file, kept small so 100k rows stay cheap"""
+    __slots__ = ('path', 'key', 'season', 'episode', 'title', 'series', 'filename', 'status', 'color',
+                 'tmdb_id', 'series_name', 'confidence', 'problem', 'row', 'watched')
+
+    def __init__(self, path, season, episode, title, filename):
+        self.path = path
+        self.key = path_key(path)
+        self.season = season
+        self.episode = episode
+        self.title = title
+        self.series = title.lower()
+        self.filename = filename
+        self.status = ''
+        self.color = None
+        # TMDB series of the title, confidence stays None until it was looked up
+        self.tmdb_id = None
+        self.series_name = None
+        self.confidence = None
+        # Why the file failed validation, invalid files are never uploaded
+        self.problem = None
+        # Position in UploadQueueModel, None while not in the table
+        self.row = None
+        # Found by the folder watcher, which may upload it automatically
+        self.watched = False
+
+    @property
+    def uploaded(self):
+        """Completed or skipped as already uploaded, both end with a check mark"""
+        return self.status.endswith('✓')
+
+    @property
+    def needs_review(self):
+        """Resolved to no series or to a doubtful one"""
+        return self.confidence is not None and (
+            self.tmdb_id is None or self.confidence < SeriesResolver.CONFIDENT
+        )
+
+    def series_text(self):
+        if self.confidence is None:
+            return "Resolving..."
+        if self.tmdb_id is None:
+            return "⚠ Not found"
+        text = f"{self.series_name} ({self.tmdb_id})"
+        return f"⚠ {text}" if self.needs_review else text
+
+
+class QueueIndex:
+    """Path keys and series groups of everything queued, including rows not shown yet"""
+
+    def __init__(self):
+        self.keys = set()
+        self.groups = {}  # series -> number of queued files
+
+    def __contains__(self, record):
+        return record.key in self.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, record):
+        """Index a record, False if its file is already queued"""
+        if record.key in self.keys:
+            return False
+        self.keys.add(record.key)
+        self.groups[record.series] = self.groups.get(record.series, 0) + 1
+        return True
+
+    def discard(self, record):
+        if record.key not in self.keys:
+            return
+        self.keys.discard(record.key)
+        self.groups[record.series] -= 1
+        if not self.groups[record.series]:
+            del self.groups[record.series]
+
+    def clear(self):
+        self.keys.clear()
+        self.groups.clear()
+
+
+class UploadQueueModel(QAbstractTableModel):
+    """Table model over the upload queue's record list.
+
+    Views ask only for the cells they paint, so no per-cell item objects
+    exist and the upload code reads records directly. Each record keeps its
+    row number, so status updates find their row without a search.
+    """
+
+    HEADERS = ["Season", "Episode", "Title", "Series", "Filename"]
+    # Same red as failed uploads
+    INVALID_COLOR = '#FFEBEE'
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.records = []
+        # Last match assigned to each series group
+        self.matches = {}
+        # Colors are shared between rows instead of one QColor per cell
+        self.colors = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.records[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return record.season
+            if column == 1:
+                return record.episode
+            if column == 2:
+                return record.title
+            if column == 3:
+                return record.series_text()
+            if record.status:
+                return f"{record.filename} ({record.status})"
+            if record.problem:
+                return f"{record.filename} (Invalid ✗ - {record.problem})"
+            return record.filename
+        if role == Qt.ItemDataRole.BackgroundRole:
+            color = record.color or (self.INVALID_COLOR if record.problem else None)
+            if not color:
+                return None
+            if color not in self.colors:
+                self.colors[color] = QColor(color)
+            return self.colors[color]
+        if role == Qt.ItemDataRole.ToolTipRole and column == 3 and record.needs_review:
+            return "Please review this series match: double-click the row to search for it"
+        if role in (Qt.ItemDataRole.UserRole, Qt.ItemDataRole.ToolTipRole):
+            return record.path
+        return None
+
+    def append_records(self, records):
+        """Append many records with a single insert notification"""
+        if not records:
+            return
+        start = len(self.records)
+        for row, record in enumerate(records, start):
+            record.row = row
+        self.beginInsertRows(QModelIndex(), start, start + len(records) - 1)
+        self.records.extend(records)
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        """Remove the given rows and return their records"""
+        rows = sorted(set(rows))
+        if not rows:
+            return []
+        # Contiguous runs, removed bottom up so earlier row numbers stay valid
+        runs = []
+        for row in rows:
+            if runs and runs[-1][1] == row - 1:
+                runs[-1][1] = row
+            else:
+                runs.append([row, row])
+
+        removed = []
+        for first, last in reversed(runs):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed.extend(self.records[first:last + 1])
+            del self.records[first:last + 1]
+            self.endRemoveRows()
+        for record in removed:
+            record.row = None
+        for row in range(rows[0], len(self.records)):
+            self.records[row].row = row
+        return removed
+
+    def move_row(self, row, target):
+        """Swap a row with its neighbour at target (row - 1 or row + 1)"""
+        # beginMoveRows wants the destination as the row to insert before
+        destination = target if target < row else target + 1
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination)
+        self.records[row], self.records[target] = self.records[target], self.records[row]
+        self.records[row].row, self.records[target].row = row, target
+        self.endMoveRows()
+
+    def set_match(self, series, match, force=False):
+        """Assign a resolved TMDB match to the records of a series group.
+
+        Records that already have a series keep it unless force is set,
+        e.g. when the user picked the series.
+        """
+        self.matches[series] = match
+        changed = []
+        for row, record in enumerate(self.records):
+            if record.series != series or (record.confidence is not None and not force):
+                continue
+            record.tmdb_id = match['tmdb_id'] if match else None
+            record.series_name = match['name'] if match else None
+            record.confidence = match['confidence'] if match else 0.0
+            changed.append(row)
+        # One notification for the whole group
+        if changed:
+            self.dataChanged.emit(self.index(changed[0], 3), self.index(changed[-1], 3))
+
+    def set_status(self, record, status, color):
+        """Update a record's status text and background color"""
+        record.status = status
+        record.color = color
+        row = record.row
+        if row is None:
+            # Removed from the queue while uploading
+            return
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
@@ -0,0 +1,139 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# Responses worth retrying: rate limited or temporarily unavailable
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Responses that mean the server turned the request away without acting on
+# it, the only ones safe to retry for calls that must not run twice
+UNPROCESSED_STATUS = {429, 503}
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting requests per second"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take one token and return how many seconds to wait before using it"""
+        if self.rate <= 0:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            # A negative balance is the debt that still has to refill
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RequestScheduler:
+    """Rate limits requests and retries transient failures with backoff.
+
+    Every call belongs to a phase (e.g. 'nid', 'upload', 'complete') with its
+    own retry budget. A Retry-After header pauses all phases, since it means
+    the whole account is being throttled.
+    """
+
+    DEFAULT_RETRY_BUDGET = {'nid': 5, 'upload': 3, 'complete': 3}
+
+    def __init__(self, requests_per_second=5, burst=None, retry_budget=None,
+                 backoff_base=1.0, backoff_max=60.0, report=print):
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self.retry_budget = dict(self.DEFAULT_RETRY_BUDGET)
+        self.retry_budget.update(retry_budget or {})
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.report = report
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def call(self, phase, send, retry_errors=(), retry_status=RETRYABLE_STATUS):
+        """Run send() under the rate limit and return its response.
+
+        send is called again for every attempt, so it must rebuild anything
+        it consumes (such as an open file). Responses with a status code in
+        retry_status and exceptions listed in retry_errors are retried;
+        other exceptions propagate.
+        """
+        attempt = 0
+        while True:
+            time.sleep(self.delay_before_request())
+            try:
+                response = send()
+            except retry_errors as e:
+                delay = self.next_delay(phase, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self.next_delay(phase, attempt, response=response, retry_status=retry_status)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            attempt += 1
+
+    async def acall(self, phase, send, retry_errors=(), retry_status=RETRYABLE_STATUS):
+        """Coroutine version of call() where send() returns an awaitable"""
+        attempt = 0
+        while True:
+            await asyncio.sleep(self.delay_before_request())
+            try:
+                response = await send()
+            except retry_errors as e:
+                delay = self.next_delay(phase, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self.next_delay(phase, attempt, response=response, retry_status=retry_status)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def delay_before_request(self):
+        """Seconds to wait for a rate-limit token and any Retry-After pause"""
+        with self.lock:
+            paused = max(0.0, self.paused_until - time.monotonic())
+        return paused + self.bucket.reserve()
+
+    def next_delay(self, phase, attempt, response=None, error=None, retry_status=RETRYABLE_STATUS):
+        """Return the delay before retrying, or None if the result is final"""
+        if response is not None and response.status_code not in retry_status:
+            return None
+        if attempt >= self.retry_budget.get(phase, 0):
+            return None
+
+        retry_after = self.retry_after(response) if response is not None else None
+        if retry_after is not None:
+            with self.lock:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            delay = retry_after
+        else:
+            # Exponential backoff with full jitter
+            delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+        reason = f"HTTP {response.status_code}" if response is not None else str(error)
+        self.report(f"SUBDL: {phase} request failed ({reason}), retry {attempt + 1} in {delay:.1f}s")
+        return delay
+
+    def retry_after(self, response):
+        """Parse a Retry-After header given in seconds or as an HTTP date"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return min(self.backoff_max, max(0.0, float(value)))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value).timestamp()
+            return min(self.backoff_max, max(0.0, retry_at - time.time()))
+        except (TypeError, ValueError):
+            return None
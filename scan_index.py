@@ -0,0 +1,96 @@
+import json
+import os
+
+from sqlite_store import SQLiteStore
+
+
+class ScanIndex(SQLiteStore):
+    """Persistent index of scanned folders for incremental rescans.
+
+    Keeps each directory's mtime and subfolders, and the (size, mtime) of the
+    subtitle files it held at the last scan. A directory whose mtime did not
+    change has the same entries, so a rescan only stats its recorded files
+    instead of listing it. Files are reported again until mark_done() records
+    them as uploaded or deliberately skipped, so a failed, removed or never
+    uploaded file is offered by the next scan, and a modified file is
+    reported once more.
+    """
+
+    def __init__(self, path='scan_index.db'):
+        super().__init__(path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS dirs (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                subdirs TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                dir TEXT NOT NULL,
+                name TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                done INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (dir, name)
+            ) WITHOUT ROWID
+        """)
+        columns = [row[1] for row in self.db.execute('PRAGMA table_info(files)')]
+        if 'done' not in columns:
+            # Indexes written before files were marked done only held files that were seen
+            self.db.execute('ALTER TABLE files ADD COLUMN done INTEGER NOT NULL DEFAULT 1')
+        self.db.commit()
+
+    def unchanged_subdirs(self, directory, mtime_ns):
+        """Subfolders recorded for a directory, or None if it changed since"""
+        with self.lock:
+            row = self.db.execute(
+                'SELECT mtime_ns, subdirs FROM dirs WHERE path = ?', (os.path.normpath(directory),)
+            ).fetchone()
+        if row and row[0] == mtime_ns:
+            return json.loads(row[1])
+        return None
+
+    def files(self, directory):
+        """Return {name: (size, mtime_ns, done)} recorded for a directory"""
+        with self.lock:
+            return self._files(os.path.normpath(directory))
+
+    def _files(self, directory):
+        return {
+            name: (size, mtime_ns, bool(done)) for name, size, mtime_ns, done in self.db.execute(
+                'SELECT name, size, mtime_ns, done FROM files WHERE dir = ?', (directory,)
+            )
+        }
+
+    def update(self, directory, mtime_ns, subdirs, files):
+        """Replace what is recorded for a directory, files is {name: (size, mtime_ns)}.
+
+        A file stays done only while its size and mtime are unchanged.
+        """
+        directory = os.path.normpath(directory)
+        with self.lock, self.db:
+            known = self._files(directory)
+            self.db.execute(
+                'INSERT OR REPLACE INTO dirs (path, mtime_ns, subdirs) VALUES (?, ?, ?)',
+                (directory, mtime_ns, json.dumps(subdirs))
+            )
+            self.db.execute('DELETE FROM files WHERE dir = ?', (directory,))
+            self.db.executemany(
+                'INSERT INTO files (dir, name, size, mtime_ns, done) VALUES (?, ?, ?, ?, ?)',
+                [(directory, name, size, mtime_ns, known.get(name) == (size, mtime_ns, True))
+                 for name, (size, mtime_ns) in files.items()]
+            )
+
+    def mark_done(self, file_paths):
+        """Record files as uploaded or deliberately skipped, later scans leave them out"""
+        with self.lock, self.db:
+            self.db.executemany(
+                'UPDATE files SET done = 1 WHERE dir = ? AND name = ?',
+                [os.path.split(os.path.normpath(file_path)) for file_path in file_paths]
+            )
+
+    def directories(self):
+        """Every directory recorded by a scan"""
+        with self.lock:
+            return [path for path, in self.db.execute('SELECT path FROM dirs')]
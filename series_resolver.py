@@ -0,0 +1,130 @@
+import asyncio
+import difflib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def normalize_title(title):
+    """Lowercase a title and drop punctuation so release and TMDB names compare"""
+    return ' '.join(re.sub(r'[^\w\s]', ' ', title.lower().replace('&', 'and')).split())
+
+
+class SeriesLookupError(Exception):
+    """TMDB could not be searched, unlike a search that found nothing"""
+
+
+class SeriesResolver:
+    """Resolve detected series titles to TMDB series.
+
+    Each title is searched once, results are cached for the session, and
+    batches of new titles are searched concurrently. A match is
+    {'tmdb_id', 'name', 'confidence'} where confidence is the similarity
+    between the detected title and the TMDB name, from 0 to 1. Matches under
+    CONFIDENT are meant to be reviewed by the user. Failed searches are not
+    cached, so the title is searched again next time.
+
+    With an AsyncTMDBApi, use resolve_async and resolve_many_async instead,
+    which keep every search in flight on one event loop.
+    """
+
+    CONFIDENT = 0.85
+
+    def __init__(self, tmdb, workers=4):
+        self.tmdb = tmdb
+        self.workers = workers
+        self.cache = {}  # normalized title -> match or None
+        self.lock = threading.Lock()
+
+    def score(self, title, show):
+        """Similarity of a detected title to a TMDB search result"""
+        title = normalize_title(title)
+        names = [name for name in (show.get('name'), show.get('original_name')) if name]
+        return max(
+            (difflib.SequenceMatcher(None, title, normalize_title(name)).ratio() for name in names),
+            default=0.0
+        )
+
+    def resolve(self, title):
+        """Return the best match for a title, or None if TMDB found nothing.
+
+        Raises SeriesLookupError if TMDB could not be searched.
+        """
+        key = normalize_title(title)
+        with self.lock:
+            if key in self.cache:
+                return self.cache[key]
+        return self._best_match(title, self.tmdb.search_tv_series_page(title))
+
+    async def resolve_async(self, title):
+        """Coroutine version of resolve, for an AsyncTMDBApi"""
+        key = normalize_title(title)
+        with self.lock:
+            if key in self.cache:
+                return self.cache[key]
+        return self._best_match(title, await self.tmdb.search_tv_series_page(title))
+
+    def _best_match(self, title, page):
+        """Pick and cache the best match of a title from a search results page"""
+        if page.get('failed'):
+            raise SeriesLookupError(f"TMDB search for {title} failed")
+
+        best = None
+        # TMDB ranks by popularity, which breaks ties between equal names
+        for show in page['results']:
+            confidence = self.score(title, show)
+            if not best or confidence > best['confidence']:
+                best = {'tmdb_id': show['id'], 'name': show['name'], 'confidence': confidence}
+
+        with self.lock:
+            self.cache[normalize_title(title)] = best
+        return best
+
+    def resolve_many(self, titles, on_result=None, on_error=None):
+        """Resolve titles concurrently, returns {title: match}.
+
+        on_result(title, match) is called from the worker threads as each
+        title is resolved. Titles whose search failed are left out of the
+        result and reported to on_error(title, error) instead.
+        """
+        titles = list(dict.fromkeys(titles))
+        results = {}
+
+        def resolve_one(title):
+            try:
+                match = self.resolve(title)
+            except SeriesLookupError as e:
+                if on_error:
+                    on_error(title, e)
+                return
+            results[title] = match
+            if on_result:
+                on_result(title, match)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(titles)))) as executor:
+            list(executor.map(resolve_one, titles))
+        return results
+
+    async def resolve_many_async(self, titles, on_result=None, on_error=None):
+        """Coroutine version of resolve_many, every title is searched at once"""
+        titles = list(dict.fromkeys(titles))
+        results = {}
+
+        async def resolve_one(title):
+            try:
+                match = await self.resolve_async(title)
+            except SeriesLookupError as e:
+                if on_error:
+                    on_error(title, e)
+                return
+            results[title] = match
+            if on_result:
+                on_result(title, match)
+
+        await asyncio.gather(*(resolve_one(title) for title in titles))
+        return results
+
+    def remember(self, title, match):
+        """Store a match chosen by the user, it wins over later searches"""
+        with self.lock:
+            self.cache[normalize_title(title)] = match
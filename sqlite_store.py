@@ -0,0 +1,58 @@
+import sqlite3
+import threading
+import time
+
+
+class SQLiteStore:
+    """One SQLite connection in WAL mode, shared by threads under a lock.
+
+    Base of the on-disk stores. Subclasses create their tables in __init__
+    and wrap every access in `with self.lock`, adding `self.db` to run it as
+    one transaction.
+    """
+
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class LRUStore(SQLiteStore):
+    """SQLiteStore whose table holds at most max_entries rows.
+
+    The subclass creates the table with a key column and a used_at column,
+    then calls _create_used_at_index(). _touch() and _evict() are called
+    inside a transaction, the least recently used rows are evicted first.
+    """
+
+    def __init__(self, path, table, key, max_entries):
+        super().__init__(path)
+        self.table = table
+        self.key = key
+        self.max_entries = max_entries
+
+    def _create_used_at_index(self):
+        self.db.execute(f'CREATE INDEX IF NOT EXISTS {self.table}_used_at ON {self.table} (used_at)')
+
+    def _touch(self, keys, now=None):
+        """Mark rows as just used"""
+        marks = ','.join('?' * len(keys))
+        self.db.execute(
+            f'UPDATE {self.table} SET used_at = ? WHERE {self.key} IN ({marks})',
+            (now or time.time(), *keys)
+        )
+
+    def _evict(self):
+        """Delete the least recently used rows over the size limit"""
+        count = self.db.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+        if count > self.max_entries:
+            self.db.execute(
+                f'DELETE FROM {self.table} WHERE {self.key} IN '
+                f'(SELECT {self.key} FROM {self.table} ORDER BY used_at LIMIT ?)',
+                (count - self.max_entries,)
+            )
@@ -1,5 +1,9 @@
 import requests
+from requests.adapters import HTTPAdapter
+from request_scheduler import RequestScheduler, UNPROCESSED_STATUS
+from multipart_stream import MultipartFileStream
 import json
+import re
 import traceback
 from pathlib import Path
 
@@ -124,9 +128,70 @@ class SubdlAPI:
         'UK': '48'    # Ukrainian
     }
 
-    def __init__(self):
+    # Framerate choices mapped to subdl framerate IDs
+    FRAMERATE_MAP = {
+        "0": 0,      # default
+        "23.976": 2, 
+        "23.980": 6,
+        "24.000": 5,
+        "25.000": 3,
+        "29.970": 4,
+        "30.000": 7
+    }
+
+    BASE_URL = 'https://api3.subdl.com'
+
+    # Connection pool defaults, overridable from settings.json
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_CONNECT_TIMEOUT = 10
+    DEFAULT_READ_TIMEOUT = 60
+    DEFAULT_REQUESTS_PER_SECOND = 5
+
+    # Calls that are harmless to repeat retry any connection failure. Calls
+    # that must not run twice only retry when the connection was never made,
+    # a dropped connection may have reached the server already
+    RETRY_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    RETRY_ERRORS_UNSAFE = (requests.exceptions.ConnectTimeout,)
+
+    def __init__(self, pool_size=None, connect_timeout=None, read_timeout=None, scheduler=None):
         self.token = self._get_token()
-        
+        settings = self._get_settings()
+        self.pool_size = int(pool_size or settings.get('subdl_pool_size', self.DEFAULT_POOL_SIZE))
+        self.timeout = (
+            float(connect_timeout or settings.get('subdl_connect_timeout', self.DEFAULT_CONNECT_TIMEOUT)),
+            float(read_timeout or settings.get('subdl_read_timeout', self.DEFAULT_READ_TIMEOUT))
+        )
+        self.session = self._create_session()
+        self.scheduler = scheduler or RequestScheduler(
+            requests_per_second=settings.get('subdl_requests_per_second', self.DEFAULT_REQUESTS_PER_SECOND),
+            retry_budget=settings.get('subdl_retry_budget'),
+            report=self._report
+        )
+
+    def _create_session(self):
+        """Create a keep-alive session shared by all upload phases"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,  # Every call goes to the same host
+            pool_maxsize=self.pool_size,
+            pool_block=True  # Wait for a free connection instead of opening extra ones
+        )
+        session.mount('https://', adapter)
+        session.headers.update({'Connection': 'keep-alive'})
+        return session
+
+    def close(self):
+        """Close the pooled connections"""
+        self.session.close()
+
+    def _get_settings(self):
+        """Read optional connection settings from settings.json"""
+        try:
+            with open('settings.json', 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
     def _get_token(self):
         """Get subdl token from settings.json"""
         try:
@@ -147,7 +212,11 @@ class SubdlAPI:
     def get_nid(self):
         """Get a unique ID from subdl API"""
         headers = {'token': self.token}
-        response = requests.get('https://api3.subdl.com/user/getNId', headers=headers)
+        response = self.scheduler.call('nid', lambda: self.session.get(
+            f'{self.BASE_URL}/user/getNId',
+            headers=headers,
+            timeout=self.timeout
+        ), self.RETRY_ERRORS)
         if response.ok:
             data = response.json()
             if data.get('ok'):
@@ -155,42 +224,48 @@ class SubdlAPI:
         self._report(f"Failed to get NID from subdl: {response.text}")
         return None
 
-    def upload_subtitle_file(self, subtitle_file):
-        """Upload a subtitle file to subdl"""
-        headers = {'token': self.token}
-        with open(subtitle_file, 'rb') as f:
-            files = {'subtitle': f}
-            response = requests.post(
-                'https://api3.subdl.com/user/uploadSingleSubtitle', 
-                headers=headers, 
-                files=files
-            )
-            if response.ok:
-                data = response.json()
-                if data.get('ok'):
-                    return data.get('file', {}).get('file_n_id')
+    def upload_subtitle_file(self, subtitle_file, on_progress=None, content=None):
+        """Upload a subtitle file to subdl, streaming it from a memory map.
+
+        on_progress(sent_bytes, total_bytes) is called while the body is sent.
+        If content is given, those bytes are uploaded under the file's name
+        instead of reading the file.
+        """
+        def send():
+            # Reopened on every attempt so retries send the whole file
+            with MultipartFileStream('subtitle', subtitle_file, on_progress, content=content) as body:
+                return self.session.post(
+                    f'{self.BASE_URL}/user/uploadSingleSubtitle', 
+                    headers={'token': self.token, 'Content-Type': body.content_type}, 
+                    data=body,
+                    timeout=self.timeout
+                )
+
+        response = self.scheduler.call('upload', send, self.RETRY_ERRORS)
+        if response.ok:
+            data = response.json()
+            if data.get('ok'):
+                return data.get('file', {}).get('file_n_id')
         self._report(f"Failed to upload subtitle file to subdl: {response.text}")
         return None
 
-    def complete_upload(self, upload_data):
-        """Complete the subtitle upload process"""
-        headers = {
-            'token': self.token,
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-        
+    def build_form_data(self, upload_data):
+        """Build the uploadSubtitle form, or return None if the language is invalid"""
         # Validate language code
         if not upload_data.get('language') in self.LANGUAGES:
             self._report(f"Invalid language code: {upload_data.get('language')}")
-            return False
+            return None
 
         # Ensure releases is a list
         releases = upload_data.get('release', [])
         if isinstance(releases, str):
             releases = [releases]
         
-        form_data = {
-            'file_n_ids': json.dumps([upload_data['file_n_id']]),
+        # Season packs carry every episode's file_n_id in one submission
+        file_n_ids = upload_data.get('file_n_ids') or [upload_data['file_n_id']]
+        
+        return {
+            'file_n_ids': json.dumps(file_n_ids),
             'tmdb_id': upload_data['tmdb_id'],
             'type': 'tv',
             'quality': 'web',
@@ -202,17 +277,29 @@ class SubdlAPI:
             'lang': upload_data['language'],
             'season': upload_data['season'],
             'hi': 'false',
-            'is_full_season': 'false',
+            'is_full_season': 'true' if upload_data.get('is_full_season') else 'false',
             'n_id': upload_data['n_id'],
             'tags': json.dumps(['subdl_pyuploader'])
         }
+
+    def complete_upload(self, upload_data):
+        """Complete the subtitle upload process"""
+        headers = {
+            'token': self.token,
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
+        
+        form_data = self.build_form_data(upload_data)
+        if form_data is None:
+            return False
         
         try:
-            response = requests.post(
-                'https://api3.subdl.com/user/uploadSubtitle',
+            response = self.scheduler.call('complete', lambda: self.session.post(
+                f'{self.BASE_URL}/user/uploadSubtitle',
                 headers=headers,
-                data=form_data
-            )
+                data=form_data,
+                timeout=self.timeout
+            ), self.RETRY_ERRORS_UNSAFE, UNPROCESSED_STATUS)
             
             try:
                 response_data = response.json()
@@ -221,20 +308,61 @@ class SubdlAPI:
             
             response.raise_for_status()
             
-            data = response.json()
-            if 'status' in data:
-                return data['status']
-            elif 'ok' in data:
-                return data['ok']
-                
-            self._report(f"Failed to complete subtitle upload to subdl: Unexpected response format")
-            return False
+            return self.parse_complete_response(response.json())
             
         except requests.exceptions.RequestException as e:
             self._report(f"Failed to complete subtitle upload to subdl: {str(e)}")
             self._report(f"SUBDL Debug - Error Details: {traceback.format_exc()}")
             return False
 
+    def parse_complete_response(self, data):
+        """Read the success flag from an uploadSubtitle response"""
+        if 'status' in data:
+            return data['status']
+        elif 'ok' in data:
+            return data['ok']
+            
+        self._report(f"Failed to complete subtitle upload to subdl: Unexpected response format")
+        return False
+
+    def build_upload_data(self, subtitle_file, file_n_id, n_id, tmdb_id, season,
+                          releases, language_id, comment="", framerate="23.976"):
+        """Build the metadata dict expected by complete_upload"""
+        return {
+            'file_n_id': file_n_id,
+            'tmdb_id': tmdb_id,
+            'name': Path(subtitle_file).stem,
+            'release': releases,
+            'season': season,
+            'n_id': n_id,
+            'language': language_id,
+            'comment': comment,
+            'framerate': framerate
+        }
+
+    def build_season_upload_data(self, subtitle_files, file_n_ids, n_id, tmdb_id, season,
+                                 releases, language_id, comment="", framerate="23.976"):
+        """Build the metadata dict for a full-season pack of several files"""
+        # Name the pack and its releases after the episodes without the episode numbers
+        name = self.season_name(Path(subtitle_files[0]).stem)
+        releases = list(dict.fromkeys(self.season_name(release) for release in releases))
+        return {
+            'file_n_ids': list(file_n_ids),
+            'tmdb_id': tmdb_id,
+            'name': name,
+            'release': releases,
+            'season': season,
+            'n_id': n_id,
+            'language': language_id,
+            'comment': comment,
+            'framerate': framerate,
+            'is_full_season': True
+        }
+
+    def season_name(self, name):
+        """Drop the episode numbers from a name, e.g. Show.S01E02E03 -> Show.S01"""
+        return re.sub(r'(?i)(S\d{1,3})(?:[-_. ]?E\d{1,4})+', r'\1', name)
+
     def upload_subtitle(self, subtitle_file, tmdb_id, season, releases, language_id, 
                    comment="", framerate="23.976", episode_from=None, episode_to=None):
         """Upload subtitle with specific language code"""
@@ -260,17 +388,10 @@ class SubdlAPI:
             print(f"uploaded subtitle file: {file_n_id}")
 
             # Step 3: Complete upload with metadata
-            upload_data = {
-                'file_n_id': file_n_id,
-                'tmdb_id': tmdb_id,
-                'name': Path(subtitle_file).stem,
-                'release': releases,
-                'season': season,
-                'n_id': n_id,
-                'language': language_id,
-                'comment': comment,
-                'framerate': framerate
-            }
+            upload_data = self.build_upload_data(
+                subtitle_file, file_n_id, n_id, tmdb_id, season,
+                releases, language_id, comment, framerate
+            )
             
             success = self.complete_upload(upload_data)
             if not success:
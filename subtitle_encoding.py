@@ -0,0 +1,51 @@
+import codecs
+import os
+
+# Bytes looked at to guess the encoding
+SAMPLE_SIZE = 64 * 1024
+CHUNK_SIZE = 256 * 1024
+# Code page assumed for text that is not valid UTF-8
+DEFAULT_LEGACY_ENCODING = 'cp1256'
+
+
+def detect_encoding(file_path, legacy=DEFAULT_LEGACY_ENCODING):
+    """Guess the encoding of a text subtitle from its first SAMPLE_SIZE bytes.
+
+    A BOM decides between UTF-8 and UTF-16, otherwise the sample is tried as
+    UTF-8 and anything that is not valid UTF-8 is taken as the legacy code page.
+    """
+    with open(file_path, 'rb') as f:
+        sample = f.read(SAMPLE_SIZE)
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if sample[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+        return 'utf-16'
+    try:
+        # A character cut at the end of a partial sample is not an error
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=len(sample) < SAMPLE_SIZE)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return legacy
+
+
+def normalize_to_utf8(file_path, legacy=DEFAULT_LEGACY_ENCODING):
+    """Return a text subtitle transcoded to UTF-8 without BOM.
+
+    Returns None when nothing needs to change, i.e. for SUP images and
+    files that are plain UTF-8 already, so those are uploaded from disk.
+    The file is decoded in chunks, characters split across chunks are
+    carried over by the incremental decoder.
+    """
+    if os.path.splitext(file_path)[1].lower() == '.sup':
+        return None
+    encoding = detect_encoding(file_path, legacy)
+    if encoding == 'utf-8':
+        return None
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    parts = []
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            parts.append(decoder.decode(chunk).encode('utf-8'))
+    parts.append(decoder.decode(b'', final=True).encode('utf-8'))
+    return b''.join(parts)
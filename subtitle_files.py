@@ -0,0 +1,288 @@
+import fnmatch
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from subtitle_validator import validate_subtitle_batch
+
+SUBTITLE_EXTENSIONS = ('.srt', '.sup', '.ass')
+
+# Folder names never descended into while scanning, overridable with the
+# scan_exclude setting. Hidden folders are skipped as well.
+EXCLUDED_DIRS = ('$RECYCLE.BIN', 'System Volume Information', '@eaDir', '#recycle', 'node_modules')
+
+# Leave one core for the GUI thread
+PARSER_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+_parser_pool = None
+_parser_pool_lock = threading.Lock()
+
+# Common release shapes handled without guessit
+FAST_PATTERNS = [
+    # Show.Name.S01E02.1080p.WEB-DL / Show Name - S01E02 - Episode Title
+    re.compile(r'^(?P<title>[^\[\](){}]+?)[\s._-]+S(?P<season>\d{1,3})[\s._-]?E(?P<episode>\d{1,4})'
+               r'(?![\d]|[\s._-]?E\d|-\d)', re.IGNORECASE),
+    # Show Name - 1x02
+    re.compile(r'^(?P<title>[^\[\](){}]+?)[\s._-]+(?P<season>\d{1,2})x(?P<episode>\d{2,3})(?![\dx])',
+               re.IGNORECASE),
+]
+
+# Title tokens guessit would strip (years, country codes), so leave those names to it
+AMBIGUOUS_TITLE_TOKEN = re.compile(r'(?:^|\s)(?:(?:19|20)\d{2}|[A-Z]{2})$')
+
+
+class FastPathStats:
+    """Thread-safe hit/miss counters of the fast-path parser"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def record(self, hit):
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def __str__(self):
+        total = self.hits + self.misses
+        rate = self.hits * 100 / total if total else 0
+        return f"fast-path parser: {self.hits} hits, {self.misses} misses ({rate:.0f}% coverage)"
+
+
+FAST_PATH_STATS = FastPathStats()
+
+# Season/episode patterns replaced in release templates
+RELEASE_PATTERNS = [
+    re.compile('S00E00'),                  # Basic pattern
+    re.compile(r'S\d{2,3}E\d{2,3}'),       # Handles both 2 and 3 digit formats
+]
+
+
+def is_subtitle_file(file_path):
+    return Path(file_path).suffix.lower() in SUBTITLE_EXTENSIONS
+
+
+def is_excluded_dir(name, excluded=EXCLUDED_DIRS):
+    return name.startswith('.') or any(fnmatch.fnmatch(name, pattern) for pattern in excluded)
+
+
+def scan_subtitle_files(paths, excluded=EXCLUDED_DIRS, is_cancelled=None, index=None):
+    """Yield the subtitle files under files and folders as they are found.
+
+    Walks with os.scandir, one directory at a time, so the first matches are
+    available long before a large tree is fully listed. Excluded and hidden
+    subfolders are skipped, folder symlinks are followed but each directory
+    is visited once, which also breaks symlink loops. Stops early once
+    is_cancelled() returns True.
+
+    With a ScanIndex only files that are new, changed, or not yet marked done
+    are yielded. Directories with an unchanged mtime are not listed, only
+    their recorded subtitle files are stat'ed to catch in-place edits.
+    """
+    visited = set()
+    for path in paths:
+        if not os.path.isdir(path):
+            if is_subtitle_file(path):
+                yield path
+            continue
+
+        stack = [path]
+        while stack:
+            if is_cancelled and is_cancelled():
+                return
+            directory = stack.pop()
+            try:
+                # os.stat, not DirEntry.stat, has real inode numbers on Windows
+                stat = os.stat(directory)
+                identity = (stat.st_dev, stat.st_ino)
+                if identity in visited:
+                    continue
+                visited.add(identity)
+                subdirs = index.unchanged_subdirs(directory, stat.st_mtime_ns) if index else None
+                if subdirs is None:
+                    subdirs = yield from _scan_directory(directory, index, stat.st_mtime_ns)
+                else:
+                    # Editing a file in place does not change its directory's mtime
+                    yield from _check_known_files(directory, index, stat.st_mtime_ns, subdirs)
+                # Unchanged directories still get their subfolders walked, those can hold changes
+                subdirs = [d for d in subdirs if not is_excluded_dir(os.path.basename(d), excluded)]
+            except OSError as e:
+                logging.warning(f"Cannot scan {directory}: {e}")
+                continue
+            # Reversed so folders are walked in listing order
+            stack.extend(reversed(subdirs))
+
+
+def _scan_directory(directory, index, mtime_ns):
+    """List one directory, yield its subtitle files that are not done and return its subfolders"""
+    known = index.files(directory) if index else {}
+    subdirs = []
+    files = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(SUBTITLE_EXTENSIONS):
+                    if index:
+                        stat = entry.stat()
+                        files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+                        if known.get(entry.name) == (*files[entry.name], True):
+                            continue
+                    yield entry.path
+            except OSError:
+                continue
+    if index:
+        index.update(directory, mtime_ns, subdirs, files)
+    return subdirs
+
+
+def _check_known_files(directory, index, mtime_ns, subdirs):
+    """Yield the recorded files of an unchanged directory that changed or are not done"""
+    known = index.files(directory)
+    files = {name: (size, file_mtime_ns) for name, (size, file_mtime_ns, _) in known.items()}
+    changed = False
+    for name, (size, file_mtime_ns, done) in known.items():
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        files[name] = (stat.st_size, stat.st_mtime_ns)
+        if files[name] != (size, file_mtime_ns):
+            changed = True
+            yield path
+        elif not done:
+            yield path
+    if changed:
+        index.update(directory, mtime_ns, subdirs, files)
+
+
+def find_subtitle_files(paths, excluded=EXCLUDED_DIRS, index=None):
+    """Expand files and folders into the list of subtitle files they contain"""
+    return list(scan_subtitle_files(paths, excluded, index=index))
+
+
+def fast_parse_filename(filename):
+    """Parse the common release shapes with regexes.
+
+    Returns file_info like guessit parsing does, or None when the name does
+    not clearly match, in which case guessit has to decide.
+    """
+    for pattern in FAST_PATTERNS:
+        if match := pattern.match(filename):
+            title = re.sub(r'[\s._]+', ' ', match.group('title')).strip(' -')
+            if not title or title.isdigit() or AMBIGUOUS_TITLE_TOKEN.search(title):
+                return None
+            return {
+                'season': str(int(match.group('season'))),
+                'episode': str(int(match.group('episode'))),
+                'title': title,
+                'filename': filename
+            }
+    return None
+
+
+def parse_subtitle_filename(file_path, fast_path=True):
+    """Parse season, episode and title from a filename.
+
+    Returns (series, file_info) where series is the lowercased title, or
+    (None, None) if no title could be found. The fast-path regexes are tried
+    first unless fast_path is False.
+    """
+    filename = os.path.basename(file_path)
+    if fast_path:
+        file_info = fast_parse_filename(filename)
+        FAST_PATH_STATS.record(file_info is not None)
+        if file_info:
+            return file_info['title'].lower(), file_info
+
+    # guessit is slow to import, so only load it once parsing is needed
+    from guessit import guessit
+
+    try:
+        guess = guessit(filename)
+        if title := guess.get('title'):
+            file_info = {
+                'season': str(guess.get('season', '')),
+                'episode': str(guess.get('episode', '')),
+                'title': title,
+                'filename': filename
+            }
+            return title.lower(), file_info
+    except Exception as e:
+        logging.error(f"Error processing file {filename}: {e}")
+    return None, None
+
+
+def parse_subtitle_batch(file_paths):
+    """Parse a chunk of files with guessit, returns [(file_path, series, file_info), ...]"""
+    return [(file_path, *parse_subtitle_filename(file_path, fast_path=False)) for file_path in file_paths]
+
+
+def process_subtitle_batch(to_parse, to_validate):
+    """Work for one chunk: parse the uncached names with guessit and validate every file.
+
+    Returns (parse_subtitle_batch results, {file_path: problem}).
+    """
+    return parse_subtitle_batch(to_parse), validate_subtitle_batch(to_validate)
+
+
+def warm_parser():
+    """Pool initializer: load guessit and its rules before the first real chunk"""
+    parse_subtitle_filename('Warm.Up.S01E01.srt', fast_path=False)
+
+
+def get_parser_pool():
+    """Return the shared process pool used for filename parsing.
+
+    Created on first use and kept for the life of the process, so later drops
+    reuse workers that already have guessit loaded. Workers are spawned, not
+    forked: a fork copies locks held by the Qt and upload threads of this
+    process and can deadlock on them.
+    """
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is None:
+            _parser_pool = ProcessPoolExecutor(
+                max_workers=PARSER_WORKERS, initializer=warm_parser,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _parser_pool
+
+
+def discard_parser_pool(pool):
+    """Drop a pool that lost a worker, the next get_parser_pool() starts a new one"""
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is pool:
+            _parser_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def process_release_templates(templates, season, episode, filename):
+    """Process release templates and replace season/episode patterns"""
+    processed_releases = []
+
+    # Format season and episode numbers with proper padding
+    season_digits = 3 if int(season) > 99 else 2
+    episode_digits = 3 if int(episode) > 99 else 2
+
+    season_str = str(season).zfill(season_digits)
+    episode_str = str(episode).zfill(episode_digits)
+
+    for template in templates:
+        if template.strip():
+            release = template
+            # Replace all patterns with actual season/episode
+            for pattern in RELEASE_PATTERNS:
+                release = pattern.sub(f'S{season_str}E{episode_str}', release)
+            processed_releases.append(release)
+
+    return processed_releases if processed_releases else [filename]  # fallback to filename if no templates
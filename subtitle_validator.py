@@ -0,0 +1,172 @@
+import codecs
+import os
+import re
+import struct
+
+# 00:01:02,345 --> 00:01:04,567 (dots and short fractions are common and accepted)
+SRT_TIMING = re.compile(
+    r'^\s*(\d{1,2}):(\d{1,2}):(\d{1,2})[,.](\d{1,3})\s*-->\s*(\d{1,2}):(\d{1,2}):(\d{1,2})[,.](\d{1,3})'
+)
+# 0:01:02.34
+ASS_TIME = re.compile(r'^\s*(\d{1,2}):(\d{2}):(\d{2})\.(\d{1,3})\s*$')
+
+# PGS segment types: palette, object, presentation, window, end
+SUP_SEGMENT_TYPES = {0x14, 0x15, 0x16, 0x17, 0x80}
+SUP_HEADER = struct.Struct('>2sIIBH')
+
+
+def _milliseconds(hours, minutes, seconds, fraction):
+    """Timestamp in ms, or None if minutes or seconds are out of range"""
+    if int(minutes) > 59 or int(seconds) > 59:
+        return None
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(fraction.ljust(3, '0'))
+
+
+def _text_encoding(file_path):
+    with open(file_path, 'rb') as f:
+        head = f.read(4)
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+        return 'utf-16'
+    return 'utf-8'
+
+
+def _read_lines(file_path, encoding):
+    with open(file_path, 'r', encoding=encoding, newline=None) as f:
+        yield from f
+
+
+def validate_srt(lines):
+    """Check SRT cues in one pass, returns an error message or None"""
+    cues = 0
+    in_cue = False
+    for number, line in enumerate(lines, 1):
+        if '\0' in line:
+            return "Binary data, not a text subtitle"
+        line = line.strip()
+        if not line:
+            in_cue = False
+            continue
+        if '-->' not in line:
+            continue
+        match = SRT_TIMING.match(line)
+        if not match:
+            return f"Line {number}: malformed timestamp"
+        start = _milliseconds(*match.groups()[:4])
+        end = _milliseconds(*match.groups()[4:])
+        if start is None or end is None:
+            return f"Line {number}: timestamp out of range"
+        if end < start:
+            return f"Line {number}: cue ends before it starts"
+        if not in_cue:
+            cues += 1
+        in_cue = True
+    return None if cues else "No subtitle cues"
+
+
+def validate_ass(lines):
+    """Check the ASS/SSA sections and dialogue lines in one pass"""
+    section = None
+    fields = None
+    dialogues = 0
+    seen_header = False
+    for number, line in enumerate(lines, 1):
+        if '\0' in line:
+            return "Binary data, not a text subtitle"
+        line = line.strip()
+        if not line or line.startswith(';'):
+            continue
+        if not seen_header:
+            if line.lower() != '[script info]':
+                return "Missing [Script Info] header"
+            seen_header = True
+        if line.startswith('[') and line.endswith(']'):
+            section = line.lower()
+            continue
+        if section != '[events]':
+            continue
+
+        key, _, value = line.partition(':')
+        if key == 'Format':
+            fields = [field.strip().lower() for field in value.split(',')]
+        elif key == 'Dialogue':
+            if not fields:
+                return f"Line {number}: dialogue before the Format line"
+            values = value.split(',', len(fields) - 1)
+            if len(values) < len(fields):
+                return f"Line {number}: dialogue has too few fields"
+            times = dict(zip(fields, values))
+            start = ASS_TIME.match(times.get('start', ''))
+            end = ASS_TIME.match(times.get('end', ''))
+            if not start or not end:
+                return f"Line {number}: malformed timestamp"
+            start = _milliseconds(*start.groups())
+            end = _milliseconds(*end.groups())
+            if start is None or end is None:
+                return f"Line {number}: timestamp out of range"
+            if end < start:
+                return f"Line {number}: dialogue ends before it starts"
+            dialogues += 1
+
+    if not seen_header:
+        return "Empty file"
+    return None if dialogues else "No dialogue lines"
+
+
+def validate_sup(file_path):
+    """Walk the PGS segment headers without reading the image data"""
+    size = os.path.getsize(file_path)
+    if size < SUP_HEADER.size:
+        return "Too small for a SUP file"
+    segments = 0
+    with open(file_path, 'rb') as f:
+        offset = 0
+        while offset < size:
+            header = f.read(SUP_HEADER.size)
+            if len(header) < SUP_HEADER.size:
+                return "Truncated segment header"
+            magic, _, _, segment_type, length = SUP_HEADER.unpack(header)
+            if magic != b'PG':
+                return "Not a PGS (SUP) file" if not segments else f"Bad segment at byte {offset}"
+            if segment_type not in SUP_SEGMENT_TYPES:
+                return f"Unknown segment type at byte {offset}"
+            offset += SUP_HEADER.size + length
+            if offset > size:
+                return "Truncated segment"
+            f.seek(offset)
+            segments += 1
+    return None
+
+
+def validate_subtitle(file_path):
+    """Check that a subtitle file is well formed.
+
+    Returns a short description of the first problem found, or None if the
+    file looks fine. Text files are read once, as UTF-8 or UTF-16 when they
+    have a BOM, falling back to a single-byte code page otherwise.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    try:
+        if extension == '.sup':
+            return validate_sup(file_path)
+
+        validate = validate_ass if extension == '.ass' else validate_srt
+        encoding = _text_encoding(file_path)
+        try:
+            return validate(_read_lines(file_path, encoding))
+        except UnicodeDecodeError:
+            if encoding != 'utf-8':
+                return "Broken text encoding"
+            # Legacy code page, every byte decodes in latin-1
+            return validate(_read_lines(file_path, 'latin-1'))
+    except OSError as e:
+        return f"Cannot read file: {e.strerror or e}"
+
+
+def validate_subtitle_batch(file_paths):
+    """Validate a chunk of files, returns {file_path: problem} for the bad ones"""
+    return {
+        file_path: problem for file_path in file_paths
+        if (problem := validate_subtitle(file_path))
+    }
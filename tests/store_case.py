@@ -0,0 +1,48 @@
+import os
+import tempfile
+import time
+import unittest
+
+
+class StoreTestCase(unittest.TestCase):
+    """Opens the SQLite store under test in a temporary directory"""
+
+    store_class = None
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(self.directory, 'store.db')
+
+    def open(self, **options):
+        store = self.store_class(self.path, **options)
+        self.addCleanup(store.close)
+        return store
+
+
+class LRUStoreTests:
+    """Eviction tests shared by the LRUStore subclasses, mixed into a StoreTestCase"""
+
+    def put(self, store, key):
+        raise NotImplementedError
+
+    def get(self, store, key):
+        """Read an entry, which marks it used, and return whether it was there"""
+        raise NotImplementedError
+
+    def test_evicts_least_recently_used(self):
+        store = self.open(max_entries=2)
+        # Spaced out so every row gets its own used_at
+        for action, key in ((self.put, 'a'), (self.put, 'b'), (self.get, 'a'), (self.put, 'c')):
+            action(store, key)
+            time.sleep(0.02)
+
+        self.assertEqual([self.get(store, key) for key in 'abc'], [True, False, True])
+
+    def test_survives_reopening(self):
+        store = self.store_class(self.path)
+        self.put(store, 'a')
+        store.close()
+
+        self.assertTrue(self.get(self.open(), 'a'))
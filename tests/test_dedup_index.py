@@ -0,0 +1,46 @@
+import os
+import shutil
+import unittest
+
+from dedup_index import DedupIndex
+from tests.store_case import StoreTestCase
+
+
+class DedupIndexTest(StoreTestCase):
+
+    store_class = DedupIndex
+
+    def setUp(self):
+        super().setUp()
+        self.index = self.open()
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_recognises_renamed_copies(self):
+        original = self.write('a.srt', 'same')
+        self.index.record(self.index.file_hash(original), 100, 1, 'AR')
+
+        moved = shutil.move(original, os.path.join(self.directory, 'b.srt'))
+        upload = self.index.is_uploaded(moved)
+
+        self.assertEqual((upload['tmdb_id'], upload['season'], upload['language']), ('100', '1', 'AR'))
+        self.assertIsNone(self.index.is_uploaded(self.write('c.srt', 'other')))
+        self.assertIsNone(self.index.is_uploaded(os.path.join(self.directory, 'missing.srt')))
+
+    def test_edited_file_is_hashed_again(self):
+        path = self.write('a.srt', 'before')
+        before = self.index.file_hash(path)
+        self.assertEqual(self.index.file_hash(path), before)
+
+        # Same size, so only the modification time tells the edit apart
+        self.write('a.srt', 'after!')
+        os.utime(path, ns=(0, 0))
+        self.assertNotEqual(self.index.file_hash(path), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from unittest import mock
+
+from parse_cache import ParseCache
+from tests.store_case import LRUStoreTests, StoreTestCase
+
+
+class ParseCacheTest(LRUStoreTests, StoreTestCase):
+
+    store_class = ParseCache
+
+    def put(self, store, key):
+        store.put_many({key: {'title': key}})
+
+    def get(self, store, key):
+        return key in store.get_many([key])
+
+    def test_round_trip(self):
+        cache = self.open()
+        cache.put_many({'Show.S01E01.srt': {'season': 1, 'episode': 1}})
+
+        self.assertEqual(cache.get_many(['Show.S01E01.srt', 'Show.S01E02.srt', 'Show.S01E01.srt']),
+                         {'Show.S01E01.srt': {'season': 1, 'episode': 1}})
+
+    def test_new_guessit_version_empties_the_cache(self):
+        with mock.patch('parse_cache.guessit_version', return_value='1.0'):
+            cache = ParseCache(self.path)
+            cache.put_many({'a': {}})
+            cache.close()
+            self.assertEqual(self.open().get_many(['a']), {'a': {}})
+        with mock.patch('parse_cache.guessit_version', return_value='2.0'):
+            self.assertEqual(self.open().get_many(['a']), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
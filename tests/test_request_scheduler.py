@@ -0,0 +1,70 @@
+import unittest
+
+from request_scheduler import UNPROCESSED_STATUS, RequestScheduler
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def scheduler(**options):
+    # No rate limit and no backoff, so tests do not sleep
+    return RequestScheduler(requests_per_second=0, backoff_base=0, report=lambda message: None, **options)
+
+
+class RequestSchedulerTest(unittest.TestCase):
+
+    def test_retries_transient_status_until_success(self):
+        responses = [FakeResponse(502), FakeResponse(429), FakeResponse(200)]
+        response = scheduler().call('upload', lambda: responses.pop(0))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(responses, [])
+
+    def test_gives_up_after_the_retry_budget(self):
+        calls = []
+
+        def send():
+            calls.append(1)
+            return FakeResponse(503)
+
+        response = scheduler(retry_budget={'nid': 2}).call('nid', send)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(calls), 3)
+
+    def test_unprocessed_status_only(self):
+        for status, retried in ((500, False), (502, False), (504, False), (429, True), (503, True)):
+            responses = [FakeResponse(status), FakeResponse(200)]
+            response = scheduler().call('complete', lambda: responses.pop(0), retry_status=UNPROCESSED_STATUS)
+            self.assertEqual(response.status_code, 200 if retried else status, status)
+
+    def test_retries_listed_errors_only(self):
+        attempts = []
+
+        def send():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError('refused')
+            return FakeResponse(200)
+
+        self.assertEqual(scheduler().call('nid', send, (ConnectionError,)).status_code, 200)
+
+        def broken():
+            attempts.append(1)
+            raise ValueError('bad')
+
+        with self.assertRaises(ValueError):
+            scheduler().call('nid', broken, (ConnectionError,))
+        self.assertEqual(len(attempts), 3)
+
+    def test_retry_after_pauses_every_phase(self):
+        shared = scheduler()
+        delay = shared.next_delay('upload', 0, response=FakeResponse(429, {'Retry-After': '7'}))
+        self.assertEqual(delay, 7)
+        self.assertGreater(shared.delay_before_request(), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import time
+import unittest
+
+from scan_index import ScanIndex
+from subtitle_files import find_subtitle_files
+from tests.store_case import StoreTestCase
+
+
+class IncrementalScanTest(StoreTestCase):
+
+    store_class = ScanIndex
+
+    def setUp(self):
+        super().setUp()
+        self.root = os.path.join(self.directory, 'shows')
+        os.makedirs(os.path.join(self.root, 'a'))
+        self.index = self.open()
+
+    def write(self, relative_path, text):
+        path = os.path.join(self.root, relative_path)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def scan(self, upload=True):
+        files = find_subtitle_files([self.root], index=self.index)
+        if upload:
+            self.index.mark_done(files)
+        return sorted(files)
+
+    def test_rescan_reports_only_new_files(self):
+        first = self.write(os.path.join('a', 'x.srt'), 'one')
+        self.assertEqual(self.scan(), [first])
+        self.assertEqual(self.scan(), [])
+
+        second = self.write(os.path.join('a', 'y.srt'), 'two')
+        self.assertEqual(self.scan(), [second])
+
+    def test_rescan_reports_files_edited_in_place(self):
+        path = self.write(os.path.join('a', 'x.srt'), 'one')
+        self.scan()
+        directory_mtime = os.stat(os.path.dirname(path)).st_mtime_ns
+
+        time.sleep(0.01)
+        self.write(os.path.join('a', 'x.srt'), 'edited')
+        # Rewriting an existing file leaves its directory untouched
+        self.assertEqual(os.stat(os.path.dirname(path)).st_mtime_ns, directory_mtime)
+        self.assertEqual(self.scan(), [path])
+        self.assertEqual(self.scan(), [])
+
+    def test_files_not_uploaded_are_offered_again(self):
+        first = self.write(os.path.join('a', 'x.srt'), 'one')
+        self.assertEqual(self.scan(upload=False), [first])
+
+        second = self.write(os.path.join('a', 'y.srt'), 'two')
+        # Listed again because the directory changed
+        self.assertEqual(self.scan(upload=False), [first, second])
+        # Only stat'ed because the directory did not change
+        self.assertEqual(self.scan(), [first, second])
+        self.assertEqual(self.scan(), [])
+
+    def test_uploaded_file_is_offered_again_once_edited(self):
+        path = self.write(os.path.join('a', 'x.srt'), 'one')
+        self.scan()
+        time.sleep(0.01)
+        self.write(os.path.join('a', 'x.srt'), 'edited')
+
+        self.assertIn(path, self.scan(upload=False))
+        self.assertIn(path, self.scan(upload=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+
+from series_resolver import SeriesLookupError, SeriesResolver
+
+
+class FakeTMDB:
+    """Answers searches from a dict, or fails while offline is set"""
+
+    def __init__(self, shows):
+        self.shows = shows
+        self.offline = False
+        self.searches = 0
+
+    def search_tv_series_page(self, query):
+        self.searches += 1
+        if self.offline:
+            return {'results': [], 'page': 1, 'total_pages': 0, 'total_results': 0, 'failed': True}
+        results = self.shows.get(query, [])
+        return {'results': results, 'page': 1, 'total_pages': 1, 'total_results': len(results)}
+
+
+class FakeAsyncTMDB(FakeTMDB):
+
+    async def search_tv_series_page(self, query):
+        await asyncio.sleep(0)
+        return FakeTMDB.search_tv_series_page(self, query)
+
+
+class SeriesResolverTest(unittest.TestCase):
+
+    def test_picks_the_closest_name(self):
+        tmdb = FakeTMDB({'The Office': [
+            {'id': 1, 'name': 'The Office Ladies'},
+            {'id': 2, 'name': 'The Office', 'original_name': 'The Office'},
+        ]})
+        match = SeriesResolver(tmdb).resolve('The Office')
+        self.assertEqual(match['tmdb_id'], 2)
+        self.assertEqual(match['confidence'], 1.0)
+
+    def test_empty_results_are_cached(self):
+        tmdb = FakeTMDB({})
+        resolver = SeriesResolver(tmdb)
+        self.assertIsNone(resolver.resolve('Unknown Show'))
+        self.assertIsNone(resolver.resolve('Unknown Show'))
+        self.assertEqual(tmdb.searches, 1)
+
+    def test_failed_searches_are_not_cached(self):
+        tmdb = FakeTMDB({'Dark': [{'id': 3, 'name': 'Dark'}]})
+        resolver = SeriesResolver(tmdb)
+        tmdb.offline = True
+        with self.assertRaises(SeriesLookupError):
+            resolver.resolve('Dark')
+
+        tmdb.offline = False
+        self.assertEqual(resolver.resolve('Dark')['tmdb_id'], 3)
+
+    def test_resolve_many_reports_failures_separately(self):
+        tmdb = FakeTMDB({})
+        tmdb.offline = True
+        failed = []
+        results = SeriesResolver(tmdb).resolve_many(['Dark'], on_error=lambda title, e: failed.append(title))
+        self.assertEqual(results, {})
+        self.assertEqual(failed, ['Dark'])
+
+    def test_resolve_many_async(self):
+        tmdb = FakeAsyncTMDB({'Dark': [{'id': 3, 'name': 'Dark'}]})
+        resolver = SeriesResolver(tmdb)
+        resolved = []
+
+        results = asyncio.run(resolver.resolve_many_async(
+            ['Dark', 'Dark', 'Unknown'], on_result=lambda title, match: resolved.append(title)
+        ))
+
+        self.assertEqual(results['Dark']['tmdb_id'], 3)
+        self.assertIsNone(results['Unknown'])
+        self.assertEqual(sorted(resolved), ['Dark', 'Unknown'])
+        self.assertEqual(tmdb.searches, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import codecs
+import os
+import struct
+import tempfile
+import unittest
+
+from subtitle_validator import validate_subtitle, validate_subtitle_batch
+
+SRT = '1\n00:00:01,000 --> 00:00:02,500\nHello\n\n2\n00:00:03.00 --> 00:00:04,000\nWorld\n'
+ASS = (
+    '[Script Info]\nTitle: test\n\n[Events]\n'
+    'Format: Layer, Start, End, Style, Text\n'
+    'Dialogue: 0,0:00:01.00,0:00:02.00,Default,Hello, world\n'
+)
+
+
+def sup_segment(segment_type, payload=b''):
+    return struct.pack('>2sIIBH', b'PG', 0, 0, segment_type, len(payload)) + payload
+
+
+class SubtitleValidatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'wb') as f:
+            f.write(content if isinstance(content, bytes) else content.encode('utf-8'))
+        return path
+
+    def test_valid_files(self):
+        paths = [
+            self.write('a.srt', SRT),
+            self.write('bom.srt', codecs.BOM_UTF8 + SRT.encode('utf-8')),
+            self.write('utf16.srt', SRT.encode('utf-16')),
+            self.write('cp1256.srt', SRT.replace('Hello', 'مرحبا').encode('cp1256')),
+            self.write('a.ass', ASS),
+            self.write('a.sup', sup_segment(0x16, b'\0' * 4) + sup_segment(0x80)),
+        ]
+        for path in paths:
+            self.assertIsNone(validate_subtitle(path), path)
+
+    def test_srt_problems(self):
+        cases = {
+            'No subtitle cues': 'just text\n',
+            'Line 2: malformed timestamp': '1\n00:00:01 --> 00:00:02\n',
+            'Line 2: timestamp out of range': '1\n00:61:01,000 --> 00:61:02,000\n',
+            'Line 2: cue ends before it starts': '1\n00:00:05,000 --> 00:00:02,000\n',
+        }
+        for problem, text in cases.items():
+            self.assertEqual(validate_subtitle(self.write('bad.srt', text)), problem)
+
+    def test_ass_problems(self):
+        cases = {
+            'Missing [Script Info] header': '[Events]\n',
+            'No dialogue lines': '[Script Info]\n[Events]\nFormat: Start, End, Text\n',
+            'Line 3: dialogue before the Format line': '[Script Info]\n[Events]\nDialogue: 0,0:00:01.00\n',
+            'Line 6: dialogue ends before it starts': ASS.replace('0:00:01.00,0:00:02.00', '0:00:03.00,0:00:02.00'),
+        }
+        for problem, text in cases.items():
+            self.assertEqual(validate_subtitle(self.write('bad.ass', text)), problem)
+
+    def test_sup_problems(self):
+        self.assertEqual(validate_subtitle(self.write('a.sup', b'x' * 20)), 'Not a PGS (SUP) file')
+        self.assertEqual(validate_subtitle(self.write('b.sup', sup_segment(0x16, b'\0' * 4)[:-2])),
+                         'Truncated segment')
+
+    def test_batch_reports_only_bad_files(self):
+        good = self.write('good.srt', SRT)
+        bad = self.write('bad.srt', '')
+        missing = os.path.join(self.directory.name, 'missing.srt')
+
+        problems = validate_subtitle_batch([good, bad, missing])
+
+        self.assertEqual(set(problems), {bad, missing})
+        self.assertTrue(problems[missing].startswith('Cannot read file'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import time
+import unittest
+
+from tests.store_case import LRUStoreTests, StoreTestCase
+from tmdb_cache import ResponseCache
+
+
+class ResponseCacheTest(LRUStoreTests, StoreTestCase):
+
+    store_class = ResponseCache
+
+    def put(self, store, key):
+        store.put(key, {'id': key})
+
+    def get(self, store, key):
+        return store.get(key) is not None
+
+    def test_round_trip_keeps_etag_and_age(self):
+        cache = self.open()
+        self.assertIsNone(cache.get('search/tv?query=show'))
+
+        cache.put('search/tv?query=show', {'results': [{'id': 1}]}, etag='"abc"')
+        data, etag, age = cache.get('search/tv?query=show')
+
+        self.assertEqual(data, {'results': [{'id': 1}]})
+        self.assertEqual(etag, '"abc"')
+        self.assertLess(age, 5)
+
+    def test_refresh_resets_the_age(self):
+        cache = self.open()
+        cache.put('tv/1', {'id': 1})
+        time.sleep(0.05)
+        _, _, age = cache.get('tv/1')
+
+        cache.refresh('tv/1')
+
+        self.assertLess(cache.get('tv/1')[2], age)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import unittest
+
+from tests.store_case import StoreTestCase
+from upload_journal import UploadJournal
+
+
+class UploadJournalTest(StoreTestCase):
+
+    store_class = UploadJournal
+
+    def setUp(self):
+        super().setUp()
+        self.journal = self.open()
+        self.subtitle = os.path.join(self.directory, 'e1.srt')
+        with open(self.subtitle, 'w') as f:
+            f.write('one')
+        self.job = {'file_path': self.subtitle, 'tmdb_id': 100, 'season': 1, 'language': 'AR'}
+
+    def test_records_each_phase(self):
+        self.assertIsNone(self.journal.get(self.job))
+
+        self.journal.record_file_n_id(self.job, 'file-1')
+        self.journal.record_n_id(self.job, 'n1')
+        self.assertEqual(self.journal.get(self.job), {'n_id': 'n1', 'file_n_id': 'file-1', 'completed': False})
+
+        self.journal.forget_file_n_id(self.job)
+        self.journal.record_completed(self.job)
+        self.assertEqual(self.journal.get(self.job), {'n_id': 'n1', 'file_n_id': None, 'completed': True})
+
+    def test_other_targets_are_separate(self):
+        self.journal.record_completed(self.job)
+        self.assertIsNone(self.journal.get(dict(self.job, season=2)))
+
+    def test_changed_file_starts_over(self):
+        self.journal.record_n_id(self.job, 'n1')
+        self.journal.record_completed(self.job)
+        with open(self.subtitle, 'w') as f:
+            f.write('edited')
+
+        self.assertIsNone(self.journal.get(self.job))
+        self.journal.record_file_n_id(self.job, 'file-2')
+        self.assertEqual(self.journal.get(self.job), {'n_id': None, 'file_n_id': 'file-2', 'completed': False})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,249 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from dedup_index import DedupIndex
+from upload_journal import UploadJournal
+from upload_pipeline import UploadPipeline
+
+
+class FakeSubdl:
+    """Stands in for SubdlAPI and records every call in order"""
+
+    token = 'token'
+
+    def __init__(self, failing_uploads=(), failing_completes=(), fail_first_upload=False):
+        self.failing_uploads = set(failing_uploads)
+        self.fail_first_upload = fail_first_upload
+        self.failing_completes = set(failing_completes)
+        self.lock = threading.Lock()
+        self.calls = []
+        self.n_ids = 0
+        self.submissions = []
+
+    def _log(self, *call):
+        with self.lock:
+            self.calls.append(call)
+
+    def get_nid(self):
+        time.sleep(0.01)
+        with self.lock:
+            self.n_ids += 1
+            n_id = f'n{self.n_ids}'
+        self._log('nid', n_id)
+        return n_id
+
+    def upload_subtitle_file(self, subtitle_file, on_progress=None, content=None):
+        time.sleep(0.01)
+        name = os.path.basename(subtitle_file)
+        with self.lock:
+            first = not any(call[0] == 'upload' for call in self.calls)
+            self.calls.append(('upload', name))
+        if name in self.failing_uploads or (first and self.fail_first_upload):
+            return None
+        if on_progress:
+            on_progress(1, 1)
+        return f'file-{name}'
+
+    def build_upload_data(self, subtitle_file, file_n_id, n_id, tmdb_id, season,
+                          releases, language_id, comment='', framerate='23.976'):
+        return {'files': [os.path.basename(subtitle_file)], 'file_n_ids': [file_n_id],
+                'n_id': n_id, 'releases': releases}
+
+    def build_season_upload_data(self, subtitle_files, file_n_ids, n_id, tmdb_id, season,
+                                 releases, language_id, comment='', framerate='23.976'):
+        return {'files': [os.path.basename(path) for path in subtitle_files],
+                'file_n_ids': list(file_n_ids), 'n_id': n_id, 'releases': releases,
+                'is_full_season': True}
+
+    def complete_upload(self, upload_data):
+        time.sleep(0.01)
+        self._log('complete', *upload_data['files'])
+        if self.failing_completes & set(upload_data['files']):
+            return False
+        with self.lock:
+            self.submissions.append(upload_data)
+        return True
+
+    def _report(self, message):
+        pass
+
+
+class FakeTMDB:
+    """Lists season 1 of every series with the given number of episodes"""
+
+    def __init__(self, episode_count):
+        self.episode_count = episode_count
+
+    def get_tv_details(self, tmdb_id):
+        return {'seasons': [{'season_number': 1, 'episode_count': self.episode_count}]}
+
+
+class UploadPipelineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def jobs(self, contents, season=1):
+        return [
+            {'file_path': self.write(name, text), 'tmdb_id': 100, 'season': season,
+             'releases': [f'Show.S01E{number:02d}.WEB'], 'language': 'AR',
+             'comment': '', 'framerate': '0', 'episode': str(number)}
+            for number, (name, text) in enumerate(contents.items(), 1)
+        ]
+
+    def run_pipeline(self, subdl, jobs, **options):
+        states = {}
+        lock = threading.Lock()
+
+        def on_progress(index, state, message):
+            with lock:
+                states.setdefault(os.path.basename(jobs[index]['file_path']), []).append(state)
+
+        pipeline = UploadPipeline(subdl, workers=2, **options)
+        return pipeline.run(jobs, on_progress), states
+
+    def test_uploads_every_file_before_completing_it(self):
+        subdl = FakeSubdl()
+        jobs = self.jobs({f'e{number}.srt': f'episode {number}' for number in range(1, 6)})
+
+        success, states = self.run_pipeline(subdl, jobs)
+
+        self.assertTrue(success)
+        for name, seen in states.items():
+            self.assertEqual(seen[0], 'processing')
+            self.assertEqual(seen[-1], 'completed')
+            uploaded = subdl.calls.index(('upload', name))
+            self.assertLess(uploaded, subdl.calls.index(('complete', name)))
+        self.assertEqual(len(states), 5)
+        # One n_id per submission, none fetched ahead and left unused
+        self.assertEqual(subdl.n_ids, 5)
+        self.assertEqual(len({data['n_id'] for data in subdl.submissions}), 5)
+
+    def test_failed_upload_fetches_no_n_id(self):
+        subdl = FakeSubdl(failing_uploads={'e1.srt'})
+        jobs = self.jobs({'e1.srt': 'one'})
+
+        success, states = self.run_pipeline(subdl, jobs)
+
+        self.assertFalse(success)
+        self.assertEqual(states['e1.srt'][-1], 'failed')
+        self.assertEqual(subdl.n_ids, 0)
+
+    def test_season_pack_is_one_submission(self):
+        subdl = FakeSubdl()
+        jobs = self.jobs({f'e{number}.srt': f'episode {number}' for number in range(1, 4)})
+
+        success, states = self.run_pipeline(subdl, jobs, season_packs=True, tmdb=FakeTMDB(3))
+
+        self.assertTrue(success)
+        self.assertEqual(subdl.n_ids, 1)
+        self.assertEqual(len(subdl.submissions), 1)
+        self.assertTrue(subdl.submissions[0]['is_full_season'])
+        self.assertEqual(subdl.submissions[0]['files'], ['e1.srt', 'e2.srt', 'e3.srt'])
+        self.assertTrue(all(seen[-1] == 'completed' for seen in states.values()))
+
+    def test_partial_season_is_sent_per_episode(self):
+        for tmdb, first_episode in ((FakeTMDB(24), 1), (None, 2)):
+            subdl = FakeSubdl()
+            jobs = self.jobs({f'e{number}.srt': f'episode {number}' for number in range(1, 4)})
+            for number, job in enumerate(jobs, first_episode):
+                job['episode'] = str(number)
+
+            success, _ = self.run_pipeline(subdl, jobs, season_packs=True, tmdb=tmdb)
+
+            self.assertTrue(success)
+            self.assertEqual(len(subdl.submissions), 3)
+            self.assertFalse(any(data.get('is_full_season') for data in subdl.submissions))
+
+    def test_season_pack_with_skipped_duplicate_is_sent_per_episode(self):
+        dedup = DedupIndex(os.path.join(self.directory.name, 'dedup.db'))
+        self.addCleanup(dedup.close)
+        subdl = FakeSubdl()
+        jobs = self.jobs({f'e{number}.srt': f'episode {number}' for number in range(1, 4)})
+        dedup.record(dedup.file_hash(jobs[1]['file_path']), 100, 1, 'AR')
+
+        success, states = self.run_pipeline(subdl, jobs, season_packs=True, dedup=dedup)
+
+        self.assertTrue(success)
+        self.assertEqual(states['e2.srt'], ['skipped'])
+        self.assertEqual(sorted(data['files'] for data in subdl.submissions), [['e1.srt'], ['e3.srt']])
+        self.assertFalse(any(data.get('is_full_season') for data in subdl.submissions))
+
+    def test_journal_resumes_without_uploading_again(self):
+        journal = UploadJournal(os.path.join(self.directory.name, 'journal.db'))
+        self.addCleanup(journal.close)
+        jobs = self.jobs({'e1.srt': 'one', 'e2.srt': 'two'})
+
+        subdl = FakeSubdl(failing_completes={'e2.srt'})
+        success, _ = self.run_pipeline(subdl, jobs, journal=journal)
+        self.assertFalse(success)
+
+        subdl = FakeSubdl()
+        success, states = self.run_pipeline(subdl, jobs, journal=journal)
+
+        self.assertTrue(success)
+        self.assertEqual(states['e1.srt'], ['skipped'])
+        self.assertEqual(states['e2.srt'][-1], 'completed')
+        # The first run's n_id and file are reused for the resumed submission
+        self.assertNotIn(('upload', 'e2.srt'), subdl.calls)
+        self.assertEqual(subdl.n_ids, 0)
+        self.assertEqual(subdl.submissions[0]['file_n_ids'], ['file-e2.srt'])
+
+    def test_journal_does_not_skip_without_skip_duplicates(self):
+        journal = UploadJournal(os.path.join(self.directory.name, 'journal.db'))
+        self.addCleanup(journal.close)
+        jobs = self.jobs({'e1.srt': 'one'})
+        success, _ = self.run_pipeline(FakeSubdl(), jobs, journal=journal)
+        self.assertTrue(success)
+
+        subdl = FakeSubdl()
+        success, states = self.run_pipeline(subdl, jobs, journal=journal, skip_duplicates=False)
+
+        self.assertTrue(success)
+        self.assertEqual(states['e1.srt'][-1], 'completed')
+        # Sent as a new submission, not as the recorded one
+        self.assertIn(('upload', 'e1.srt'), subdl.calls)
+        self.assertEqual(subdl.n_ids, 1)
+
+    def test_copies_are_skipped_once_the_first_is_uploaded(self):
+        dedup = DedupIndex(os.path.join(self.directory.name, 'dedup.db'))
+        self.addCleanup(dedup.close)
+        subdl = FakeSubdl()
+        jobs = self.jobs({'a.srt': 'same', 'b.srt': 'same', 'c.srt': 'other', 'd.srt': 'same'})
+
+        success, states = self.run_pipeline(subdl, jobs, dedup=dedup)
+
+        self.assertTrue(success)
+        # Any copy may be hashed first, that one is uploaded
+        copies = sorted(states[name][-1] for name in ('a.srt', 'b.srt', 'd.srt'))
+        self.assertEqual(copies, ['completed', 'skipped', 'skipped'])
+        self.assertEqual(subdl.n_ids, 2)
+
+    def test_copies_are_not_skipped_when_the_first_fails(self):
+        dedup = DedupIndex(os.path.join(self.directory.name, 'dedup.db'))
+        self.addCleanup(dedup.close)
+        # Whichever copy is hashed first uploads it, and that upload fails
+        subdl = FakeSubdl(fail_first_upload=True)
+        jobs = self.jobs({'a.srt': 'same', 'b.srt': 'same'})
+
+        success, states = self.run_pipeline(subdl, jobs, dedup=dedup)
+
+        self.assertFalse(success)
+        self.assertFalse(any('skipped' in seen for seen in states.values()))
+        # The copy that waited for it still gets a final state
+        self.assertEqual(states['a.srt'][-1], 'failed')
+        self.assertEqual(states['b.srt'][-1], 'failed')
+
+
+if __name__ == '__main__':
+    unittest.main()
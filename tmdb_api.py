@@ -1,42 +1,101 @@
+from urllib.parse import urlencode
+
 import requests
 
 class TMDBApi:
-    def __init__(self, api_key):
+    # Seconds a cached response is used without asking TMDB again
+    CACHE_TTL = {
+        'search/tv': 24 * 3600,
+        'tv': 7 * 24 * 3600,
+    }
+
+    def __init__(self, api_key, cache=None, timeout=(10, 30)):
         self.api_key = api_key
         self.base_url = "https://api.themoviedb.org/3"
         self.headers = {
             "accept": "application/json",
             "Authorization": f"Bearer {api_key}"
         }
+        self.cache = cache
+        self.timeout = timeout
+        self.session = requests.Session()
+    
+    def _get(self, endpoint, path, params=None):
+        """GET a TMDB endpoint through the response cache.
+
+        Fresh entries are returned without a request, expired ones are
+        revalidated with their ETag, and if TMDB cannot be reached or answers
+        with an error a stale entry is better than nothing.
+        """
+        key = self._cache_key(path, params)
+        cached = self.cache.get(key) if self.cache else None
+        if cached and cached[2] < self.CACHE_TTL[endpoint]:
+            return cached[0]
+
+        headers = dict(self.headers)
+        if cached and cached[1]:
+            headers['If-None-Match'] = cached[1]
+        try:
+            response = self.session.get(
+                f"{self.base_url}/{path}", headers=headers, params=params, timeout=self.timeout
+            )
+            if response.status_code == 304 and cached:
+                self.cache.refresh(key)
+                return cached[0]
+            # Error statuses such as a TMDB 5xx fall back to the stale entry too
+            response.raise_for_status()
+        except requests.RequestException:
+            if cached:
+                return cached[0]
+            raise
+
+        data = response.json()
+        if self.cache:
+            self.cache.put(key, data, response.headers.get('ETag'))
+        return data
+
+    def _cache_key(self, path, params):
+        return f"{path}?{urlencode(sorted((params or {}).items()))}"
+
+    def _search_page(self, data, page):
+        """Pick the fields of a search response returned by search_tv_series_page"""
+        return {
+            'results': data.get('results', []),
+            'page': data.get('page', page),
+            'total_pages': data.get('total_pages', page),
+            'total_results': data.get('total_results', 0)
+        }
     
     def search_tv_series(self, query):
         """Search for TV series and return results"""
-        url = f"{self.base_url}/search/tv"
+        return self.search_tv_series_page(query)['results']
+
+    def search_tv_series_page(self, query, page=1):
+        """Search for TV series and return one page of results.
+
+        Returns a dict with results, page, total_pages and total_results.
+        If TMDB could not be asked, results are empty and failed is True.
+        """
         params = {
             'query': query,
             'include_adult': False,
             'language': 'en-US',
-            'page': 1
+            'page': page
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data.get('results', [])
+            return self._search_page(self._get('search/tv', 'search/tv', params), page)
         except Exception as e:
             print(f"TMDB API Error: {str(e)}")
-            return []
+            return {'results': [], 'page': page, 'total_pages': 0, 'total_results': 0, 'failed': True}
 
     def get_tv_details(self, tmdb_id):
         """Get detailed information about a TV series"""
-        url = f"{self.base_url}/tv/{tmdb_id}"
-        
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            return data
+            return self._get('tv', f"tv/{tmdb_id}")
         except Exception as e:
             print(f"TMDB API Error: {str(e)}")
-            return {}
\ No newline at end of file
+            return {}
+
+    def close(self):
+        self.session.close()
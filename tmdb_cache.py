@@ -0,0 +1,56 @@
+import json
+import time
+
+from sqlite_store import LRUStore
+
+
+class ResponseCache(LRUStore):
+    """On-disk cache of TMDB JSON responses.
+
+    Entries are keyed by endpoint and query parameters and keep the ETag
+    they were served with, so expired entries can be revalidated with a
+    conditional request instead of downloaded again. Holds at most
+    max_entries rows, evicting the least recently used ones.
+    """
+
+    def __init__(self, path='tmdb_cache.db', max_entries=5000):
+        super().__init__(path, 'responses', 'key', max_entries)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                etag TEXT,
+                fetched_at REAL NOT NULL,
+                used_at REAL NOT NULL
+            )
+        """)
+        self._create_used_at_index()
+        self.db.commit()
+
+    def get(self, key):
+        """Return (data, etag, age in seconds) of a cached response, or None"""
+        now = time.time()
+        with self.lock, self.db:
+            row = self.db.execute(
+                'SELECT data, etag, fetched_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if not row:
+                return None
+            self._touch([key], now)
+        return json.loads(row[0]), row[1], now - row[2]
+
+    def put(self, key, data, etag=None):
+        """Store a fresh response and evict the oldest rows over the size limit"""
+        now = time.time()
+        with self.lock, self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO responses (key, data, etag, fetched_at, used_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, json.dumps(data), etag, now, now)
+            )
+            self._evict()
+
+    def refresh(self, key):
+        """Mark a cached response as fresh after the server confirmed it unchanged"""
+        with self.lock, self.db:
+            self.db.execute('UPDATE responses SET fetched_at = ? WHERE key = ?', (time.time(), key))
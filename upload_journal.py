@@ -0,0 +1,92 @@
+import os
+from datetime import datetime
+
+from sqlite_store import SQLiteStore
+
+
+class UploadJournal(SQLiteStore):
+    """Durable record of each file's progress through the upload phases.
+
+    A row is keyed by the file and the upload target, and remembers the n_id,
+    the file_n_id and whether complete_upload succeeded, so an interrupted
+    batch can resume without uploading finished files again. Rows are ignored
+    once the file's size or modification time changes.
+    """
+
+    def __init__(self, path='upload_journal.db'):
+        super().__init__(path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS uploads (
+                file_path TEXT NOT NULL,
+                tmdb_id TEXT NOT NULL,
+                season TEXT NOT NULL,
+                language TEXT NOT NULL,
+                size INTEGER,
+                mtime_ns INTEGER,
+                n_id TEXT,
+                file_n_id TEXT,
+                completed_at TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (file_path, tmdb_id, season, language)
+            )
+        """)
+        self.db.commit()
+
+    def _key(self, job):
+        return (os.path.abspath(job['file_path']), str(job['tmdb_id']),
+                str(job['season']), job['language'])
+
+    def _stat(self, job):
+        stat = os.stat(job['file_path'])
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, job):
+        """Return the recorded progress of a job, or None if there is none"""
+        try:
+            size, mtime_ns = self._stat(job)
+        except OSError:
+            return None
+        with self.lock:
+            row = self.db.execute(
+                'SELECT size, mtime_ns, n_id, file_n_id, completed_at FROM uploads '
+                'WHERE file_path = ? AND tmdb_id = ? AND season = ? AND language = ?',
+                self._key(job)
+            ).fetchone()
+        if not row or row[0] != size or row[1] != mtime_ns:
+            return None
+        return {'n_id': row[2], 'file_n_id': row[3], 'completed': row[4] is not None}
+
+    def _update(self, job, **fields):
+        size, mtime_ns = self._stat(job)
+        now = datetime.now().isoformat(timespec='seconds')
+        with self.lock, self.db:
+            # Start a fresh row if the file changed since it was recorded
+            self.db.execute(
+                'INSERT INTO uploads (file_path, tmdb_id, season, language, size, mtime_ns, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (file_path, tmdb_id, season, language) DO UPDATE SET '
+                'n_id = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns THEN n_id END, '
+                'file_n_id = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns THEN file_n_id END, '
+                'completed_at = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns THEN completed_at END, '
+                'size = excluded.size, mtime_ns = excluded.mtime_ns, updated_at = excluded.updated_at',
+                (*self._key(job), size, mtime_ns, now)
+            )
+            for column, value in fields.items():
+                self.db.execute(
+                    f'UPDATE uploads SET {column} = ? '
+                    'WHERE file_path = ? AND tmdb_id = ? AND season = ? AND language = ?',
+                    (value, *self._key(job))
+                )
+
+    def record_n_id(self, job, n_id):
+        self._update(job, n_id=n_id)
+
+    def record_file_n_id(self, job, file_n_id):
+        self._update(job, file_n_id=file_n_id)
+
+    def record_completed(self, job):
+        self._update(job, completed_at=datetime.now().isoformat(timespec='seconds'))
+
+    def forget_file_n_id(self, job):
+        """Drop a file_n_id that subdl did not accept, so it is uploaded again"""
+        self._update(job, file_n_id=None)
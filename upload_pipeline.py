@@ -0,0 +1,378 @@
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from subtitle_encoding import DEFAULT_LEGACY_ENCODING, normalize_to_utf8
+
+
+def format_rate(bytes_per_second):
+    """Format a transfer rate for status text"""
+    for unit in ('B/s', 'KB/s', 'MB/s'):
+        if bytes_per_second < 1024:
+            return f"{bytes_per_second:.0f} {unit}" if unit == 'B/s' else f"{bytes_per_second:.1f} {unit}"
+        bytes_per_second /= 1024
+    return f"{bytes_per_second:.1f} GB/s"
+
+
+class UploadTask:
+    """Per-file state carried through the pipeline stages"""
+    __slots__ = ('index', 'job', 'entry', 'file_n_id', 'digest', 'pack')
+
+    def __init__(self, index, job, entry):
+        self.index = index
+        self.job = job
+        self.entry = entry or {}
+        self.file_n_id = self.entry.get('file_n_id')
+        self.digest = None
+        self.pack = None
+
+
+class SeasonPack:
+    """Files of one season that are submitted together once all are uploaded"""
+    __slots__ = ('tasks', 'uploaded', 'pending', 'failed', 'skipped', 'lock')
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.uploaded = []
+        self.pending = len(tasks)
+        self.failed = False
+        self.skipped = False
+        self.lock = threading.Lock()
+
+    def file_done(self, task, uploaded):
+        """Record a member's outcome, return True once every member is done"""
+        with self.lock:
+            if uploaded:
+                self.uploaded.append(task)
+            elif uploaded is None:
+                # Without a skipped duplicate the season is no longer full
+                self.skipped = True
+            else:
+                self.failed = True
+            self.pending -= 1
+            return self.pending == 0
+
+
+class UploadPipeline:
+    """Run the three subdl upload phases concurrently across many files.
+
+    File bytes are sent on one worker pool while n_ids are fetched and
+    metadata calls run on a second one, so file N+1 is uploading while
+    file N is still being completed. An n_id is only fetched for a file
+    whose bytes were uploaded. With a journal, every phase is recorded
+    and files interrupted by an earlier run are resumed. Files it finished are
+    skipped too, unless skip_duplicates is off. With a dedup
+    index, byte-identical copies of uploaded subtitles are skipped; a copy
+    of a file still uploading in the same batch waits for that upload and
+    is only skipped if it succeeds. With season_packs, all files of a
+    complete season share one n_id and are submitted in a single full-season
+    uploadSubtitle call. A season is complete when its episodes run from 1
+    to the episode count TMDB lists for it, or without a tmdb client, from 1
+    with no gaps. With normalize_encoding, text subtitles in legacy_encoding or
+    UTF-16 are transcoded to UTF-8 by the file workers and sent from memory.
+    """
+
+    def __init__(self, subdl, workers=4, journal=None, dedup=None,
+                 skip_duplicates=True, season_packs=False, normalize_encoding=False,
+                 legacy_encoding=DEFAULT_LEGACY_ENCODING, tmdb=None):
+        self.subdl = subdl
+        self.workers = max(1, workers)
+        self.journal = journal
+        self.dedup = dedup
+        self.skip_duplicates = skip_duplicates
+        self.season_packs = season_packs
+        self.normalize_encoding = normalize_encoding
+        self.legacy_encoding = legacy_encoding
+        self.tmdb = tmdb
+        self.success = True
+
+    def run(self, jobs, on_progress, is_paused=lambda: False, is_cancelled=lambda: False):
+        """Upload every job and return True if all of them succeeded.
+
+        Each job is a dict with file_path, tmdb_id, season, releases, language,
+        comment and framerate. on_progress(index, state, message) is called
+        from worker threads with state 'processing', 'uploading' (message has
+        the percent and rate), 'completed', 'skipped' (already uploaded
+        before) or 'failed'.
+        """
+        self.on_progress = on_progress
+        self.success = True
+
+        if not self.subdl.token:
+            self.subdl._report("SUBDL: Upload failed - Missing subdl token")
+            for index in range(len(jobs)):
+                on_progress(index, 'failed', 'Missing subdl token')
+            return False
+
+        tasks = [UploadTask(index, job, self._journal_entry(job)) for index, job in enumerate(jobs)]
+        self.packs = []
+        if self.season_packs:
+            self._group_season_packs(tasks)
+        # digest -> the task uploading it, or True once it is uploaded
+        self.digests = {}
+        self.digests_lock = threading.Lock()
+
+        # Copies of files that were still uploading get another pass,
+        # where they are skipped once the first copy is uploaded
+        self.deferred = []
+        while tasks:
+            self.deferred = []
+            self._run_pass(tasks, is_paused, is_cancelled)
+            if is_cancelled() or not self.success or len(self.deferred) == len(tasks):
+                break
+            tasks = sorted(self.deferred, key=lambda task: task.index)
+
+        # Copies left waiting when the batch stopped early never got their turn
+        for task in sorted(self.deferred, key=lambda task: task.index):
+            self.success = False
+            self.on_progress(task.index, 'failed', 'Not uploaded, the batch stopped first')
+
+        # Packs cut short by a cancel or failure were never submitted
+        for pack in self.packs:
+            if pack.pending and pack.uploaded:
+                self.success = False
+                for task in pack.uploaded:
+                    self.on_progress(task.index, 'failed', 'Season pack incomplete')
+
+        return self.success
+
+    def _journal_entry(self, job):
+        """Recorded progress to resume a job from, None to start it from scratch"""
+        entry = self.journal.get(job) if self.journal else None
+        # A finished upload is skipped like any other duplicate, or sent again as a new one
+        if entry and entry['completed'] and not self.skip_duplicates:
+            return None
+        return entry
+
+    def _run_pass(self, tasks, is_paused, is_cancelled):
+        """Feed tasks through the file and metadata stages until all are done"""
+        # Files in flight across both stages
+        self.slots = threading.Semaphore(self.workers * 2)
+        file_stage = ThreadPoolExecutor(self.workers, thread_name_prefix='subdl-file')
+        self.meta_stage = ThreadPoolExecutor(self.workers, thread_name_prefix='subdl-meta')
+
+        try:
+            for task in tasks:
+                self.slots.acquire()
+
+                # Handle pause before starting the next file
+                while is_paused() and not is_cancelled():
+                    time.sleep(0.1)
+
+                # Stop scheduling on cancel or after the first failure
+                if is_cancelled() or not self.success:
+                    self.slots.release()
+                    break
+
+                if task.entry.get('completed'):
+                    self.on_progress(task.index, 'skipped', 'Already uploaded')
+                    self.slots.release()
+                    continue
+
+                file_stage.submit(self._upload_file, task)
+        finally:
+            # The file stage feeds the metadata stage, so drain it first
+            file_stage.shutdown(wait=True)
+            self.meta_stage.shutdown(wait=True)
+
+    def _byte_progress(self, task):
+        """Return a callback turning sent bytes into an 'uploading' status"""
+        started = time.monotonic()
+
+        def report(sent, total):
+            elapsed = max(time.monotonic() - started, 0.001)
+            percent = sent * 100 // total if total else 100
+            self.on_progress(task.index, 'uploading', f"Uploading {percent}% ({format_rate(sent / elapsed)})")
+        return report
+
+    def _group_season_packs(self, tasks):
+        """Assign tasks of the same season to season packs"""
+        groups = {}
+        self.packs = []
+        for task in tasks:
+            job = task.job
+            groups.setdefault((str(job['tmdb_id']), str(job['season']), job['language']), []).append(task)
+
+        for (tmdb_id, season, _), members in groups.items():
+            # Episodes uploaded by an earlier run make the rest a partial season,
+            # and a single file is uploaded on its own, not as a full season
+            if (len(members) > 1 and not any(task.entry.get('completed') for task in members)
+                    and self._is_full_season(members, tmdb_id, season)):
+                pack = SeasonPack(members)
+                self.packs.append(pack)
+                for task in members:
+                    task.pack = pack
+
+    def _is_full_season(self, members, tmdb_id, season):
+        """True if the members are episodes 1 to N of the season, and N is all it has"""
+        episodes = [str(task.job.get('episode', '')) for task in members]
+        if not all(episode.isdigit() for episode in episodes):
+            return False
+        if sorted(map(int, episodes)) != list(range(1, len(members) + 1)):
+            return False
+        if not self.tmdb:
+            return True
+        details = self.tmdb.get_tv_details(tmdb_id)
+        for entry in details.get('seasons', []):
+            if str(entry.get('season_number')) == season:
+                return entry.get('episode_count') == len(members)
+        # Unknown to TMDB or not reachable, so it cannot be called complete
+        return False
+
+    def _finish_file(self, task, uploaded):
+        """Hand a file to the metadata stage, directly or through its pack"""
+        if not task.pack:
+            if uploaded:
+                self.meta_stage.submit(self._complete, task)
+            else:
+                self.slots.release()
+            return
+
+        # Pack members free their slot now, otherwise a season larger than
+        # the in-flight limit could never finish uploading
+        self.slots.release()
+        if task.pack.file_done(task, uploaded):
+            self.meta_stage.submit(self._complete_pack, task.pack)
+
+    def _upload_file(self, task):
+        """Stage 1: send the subtitle bytes unless an earlier run already did"""
+        try:
+            if self.dedup:
+                task.digest = self.dedup.file_hash(task.job['file_path'])
+                with self.digests_lock:
+                    # Copies within this batch are not in the index yet
+                    first = self.digests.setdefault(task.digest, task)
+                # Identical episodes of one pack are still separate files of it
+                copy = first is not task and not (task.pack and first is not True and first.pack is task.pack)
+                if self.skip_duplicates and (first is True or self.dedup.lookup(task.digest)):
+                    self.on_progress(task.index, 'skipped', 'Duplicate of an uploaded subtitle')
+                    self._finish_file(task, None)
+                    return
+                if self.skip_duplicates and copy:
+                    # Decided in the next pass, once the first copy is done
+                    self.deferred.append(task)
+                    self.slots.release()
+                    return
+
+            self.on_progress(task.index, 'processing', '')
+            if not task.file_n_id:
+                content = None
+                if self.normalize_encoding:
+                    content = normalize_to_utf8(task.job['file_path'], self.legacy_encoding)
+                task.file_n_id = self.subdl.upload_subtitle_file(
+                    task.job['file_path'], self._byte_progress(task), content=content
+                )
+                if not task.file_n_id:
+                    raise Exception('Failed to upload subtitle file')
+                if self.journal:
+                    self.journal.record_file_n_id(task.job, task.file_n_id)
+        except Exception as e:
+            self._fail(task, e)
+            self._finish_file(task, False)
+        else:
+            self._finish_file(task, True)
+
+    def _complete(self, task, holds_slot=True):
+        """Stage 2: fetch an n_id and submit the metadata"""
+        job = task.job
+        # A pack member sent on its own cannot reuse the n_id shared by the pack
+        recorded_n_id = task.entry.get('n_id') if not task.pack else None
+        try:
+            # Reusing the recorded n_id keeps a resumed submission the same one
+            n_id = recorded_n_id or self.subdl.get_nid()
+            if not n_id:
+                raise Exception('Failed to get NID')
+            if self.journal and not recorded_n_id:
+                self.journal.record_n_id(job, n_id)
+
+            upload_data = self.subdl.build_upload_data(
+                job['file_path'], task.file_n_id, n_id, job['tmdb_id'], job['season'],
+                job['releases'], job['language'], job['comment'], job['framerate']
+            )
+            if not self.subdl.complete_upload(upload_data):
+                if self.journal and task.entry.get('file_n_id'):
+                    # The recorded file may have expired on subdl's side
+                    self.journal.forget_file_n_id(job)
+                raise Exception('Failed to complete subtitle upload')
+            if self.journal:
+                self.journal.record_completed(job)
+            if self.dedup:
+                self.dedup.record(task.digest, job['tmdb_id'], job['season'], job['language'])
+                self._digest_done(task, True)
+
+            self.subdl._report(f"SUBDL: Successfully uploaded subtitle {Path(job['file_path']).name}")
+            self.on_progress(task.index, 'completed', '')
+        except Exception as e:
+            self._fail(task, e)
+        finally:
+            if holds_slot:
+                self.slots.release()
+
+    def _complete_pack(self, pack):
+        """Stage 2 for season packs: one n_id and one metadata call for all files"""
+        tasks = sorted(pack.uploaded, key=lambda task: task.index)
+        if not tasks:
+            return
+        if pack.skipped and not pack.failed:
+            # Only a whole season is a full-season upload, the rest go one by one
+            for task in tasks:
+                self._complete(task, holds_slot=False)
+            return
+        job = tasks[0].job
+        try:
+            if pack.failed:
+                raise Exception('Season pack incomplete, another episode failed')
+
+            recorded = {task.entry.get('n_id') for task in tasks} - {None}
+            n_id = recorded.pop() if len(recorded) == 1 else self.subdl.get_nid()
+            if not n_id:
+                raise Exception('Failed to get NID')
+            if self.journal:
+                for task in tasks:
+                    self.journal.record_n_id(task.job, n_id)
+
+            # Every episode's releases, reduced to season names by build_season_upload_data
+            releases = [release for task in tasks for release in task.job['releases']]
+            upload_data = self.subdl.build_season_upload_data(
+                [task.job['file_path'] for task in tasks],
+                [task.file_n_id for task in tasks],
+                n_id, job['tmdb_id'], job['season'], releases,
+                job['language'], job['comment'], job['framerate']
+            )
+            if not self.subdl.complete_upload(upload_data):
+                if self.journal:
+                    for task in tasks:
+                        if task.entry.get('file_n_id'):
+                            self.journal.forget_file_n_id(task.job)
+                raise Exception('Failed to complete season pack upload')
+
+            self.subdl._report(f"SUBDL: Successfully uploaded season {job['season']} pack of {len(tasks)} files")
+            for task in tasks:
+                if self.journal:
+                    self.journal.record_completed(task.job)
+                if self.dedup:
+                    self.dedup.record(task.digest, job['tmdb_id'], job['season'], job['language'])
+                    self._digest_done(task, True)
+                self.on_progress(task.index, 'completed', '')
+        except Exception as e:
+            for task in tasks:
+                self._fail(task, e)
+
+    def _digest_done(self, task, uploaded):
+        """Settle a digest for the copies waiting on this task's upload"""
+        with self.digests_lock:
+            if uploaded:
+                self.digests[task.digest] = True
+            elif self.digests.get(task.digest) is task:
+                # The next copy gets to upload it instead
+                del self.digests[task.digest]
+
+    def _fail(self, task, error):
+        self.success = False
+        if task.digest:
+            self._digest_done(task, False)
+        self.subdl._report(f"SUBDL: Upload of {Path(task.job['file_path']).name} failed - {error}")
+        self.subdl._report(f"SUBDL Debug - Error Details: {traceback.format_exc()}")
+        self.on_progress(task.index, 'failed', str(error))
@@ -1,24 +1,41 @@
 import json
 import os
+import time
 import requests
 from pathlib import Path
-from PyQt6.QtGui import QPixmap, QColor
-from PyQt6.QtCore import QByteArray, Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QByteArray, Qt, QThread, QTimer, pyqtSignal
 from pathlib import Path
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QApplication,
-                            QPushButton, QDialog, QLineEdit, QFormLayout, QTableWidget,
-                            QDialogButtonBox, QLabel, QMessageBox, QTableWidgetItem,
+                            QPushButton, QDialog, QLineEdit, QFormLayout, QTableView,
+                            QDialogButtonBox, QLabel, QMessageBox, QHeaderView,
                             QFileDialog, QTabWidget, QListWidget, QListWidgetItem, 
                             QScrollArea, QFrame, QTextEdit, QComboBox, 
-                            QSpinBox, QGroupBox, QProgressDialog)  
+                            QSpinBox, QGroupBox, QProgressDialog, QCheckBox)  
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent
-from guessit import guessit
 from subdl_api import SubdlAPI
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from subtitle_files import (scan_subtitle_files, process_subtitle_batch, fast_parse_filename,
+                            get_parser_pool, discard_parser_pool, process_release_templates,
+                            FAST_PATH_STATS, PARSER_WORKERS, EXCLUDED_DIRS)
+from upload_pipeline import UploadPipeline
+from upload_journal import UploadJournal
+from dedup_index import DedupIndex
+from parse_cache import ParseCache
+from scan_index import ScanIndex
+from folder_watcher import FolderWatcher
+from series_resolver import SeriesResolver
+from subtitle_encoding import DEFAULT_LEGACY_ENCODING
+from queue_model import QueueIndex, QueueRecord, UploadQueueModel, needs_review
 from tmdb_api import TMDBApi
+from tmdb_cache import ResponseCache
+from async_api import AsyncLoopThread, AsyncTMDBApi
 import logging
 
-class DragDropTable(QTableWidget):
+class DragDropTable(QTableView):
     file_dropped = pyqtSignal(list)
     
     def __init__(self, *args, **kwargs):
@@ -48,15 +65,26 @@ class DragDropTable(QTableWidget):
 
 class SubdlUploaderWindow(QMainWindow):
     # Add framerate mapping as class attribute
-    FRAMERATE_MAP = {
-        "0": 0,      # default
-        "23.976": 2, 
-        "23.980": 6,
-        "24.000": 5,
-        "25.000": 3,
-        "29.970": 4,
-        "30.000": 7
-    }
+    FRAMERATE_MAP = SubdlAPI.FRAMERATE_MAP
+    
+    # Sent from the asyncio loop thread, delivered on the GUI thread
+    async_result = pyqtSignal(object, object)  # (callback, concurrent.futures.Future)
+    series_resolved = pyqtSignal(str, object)  # (title, match or None)
+    series_lookup_failed = pyqtSignal(str)  # title whose TMDB search failed
+    
+    # Typing pause before a live search is sent
+    SEARCH_DEBOUNCE_MS = 300
+    # Shorter queries are only searched on Enter
+    SEARCH_MIN_LENGTH = 2
+    # Recent queries kept for instant results and prefix previews
+    SEARCH_RESULTS_KEPT = 200
+    # Result cards are built this many at a time, as the user scrolls
+    CARD_BATCH = 8
+    NO_RESULTS_TEXT = "No TV series found.\nTry different keywords."
+    # Wait before searching again for titles whose TMDB lookup failed
+    RESOLVE_RETRY_MS = 30000
+    # Parsed files are inserted into the table at most this often
+    TABLE_REFRESH_MS = 100
 
     def __init__(self):
         super().__init__()
@@ -84,10 +112,45 @@ class SubdlUploaderWindow(QMainWindow):
         # Initialize other attributes after UI elements exist
         self.settings = self.initialize_settings()
         self.subdl = SubdlAPI()
-        self.added_files = set()
-        self.tmdb = TMDBApi(self.settings.get('tmdb_api_key', ''))
+        self.upload_journal = UploadJournal()
+        self.dedup_index = DedupIndex()
+        self.parse_cache = ParseCache()
+        self.scan_index = ScanIndex()
+        # Every queued file, shown or still pending, for O(1) duplicate and series checks
+        self.queue_index = QueueIndex()
+        self.tmdb_cache = ResponseCache()
+        # Blocking client for the upload thread's season pack checks
+        self.tmdb = TMDBApi(self.settings.get('tmdb_api_key', ''), self.tmdb_cache)
+        # Searches and series lookups all run on one asyncio loop thread
+        self.async_loop = AsyncLoopThread()
+        self.async_tmdb = AsyncTMDBApi(self.settings.get('tmdb_api_key', ''), self.tmdb_cache)
+        self.async_result.connect(self.deliver_async_result)
         self.image_cache = ImageCache()
-        self.selected_series = None
+        
+        # Title groups are resolved to TMDB series in the background
+        self.series_resolver = SeriesResolver(self.async_tmdb)
+        self.resolving = set()
+        self.series_resolved.connect(self.handle_series_resolved)
+        self.series_lookup_failed.connect(self.handle_series_lookup_failed)
+        # Series picked while the queue was empty, used for the files added next
+        self.preselected_match = None
+        self.upload_thread = None
+        self.uploading = False
+        # Folder scan of the last drop, kept until the thread has finished
+        self.processing_thread = None
+        
+        # Folder watch mode
+        self.folder_watcher = None
+        self.watch_thread = None
+        self.watch_backlog = []
+        self.auto_upload_requested = False
+        
+        # Parsed files wait here until the next table refresh
+        self.pending_rows = []
+        self.table_refresh_timer = QTimer(self)
+        self.table_refresh_timer.setSingleShot(True)
+        self.table_refresh_timer.setInterval(self.TABLE_REFRESH_MS)
+        self.table_refresh_timer.timeout.connect(self.flush_pending_rows)
         
         # Set window size and position
         self.resize(1200, 600)
@@ -106,6 +169,34 @@ class SubdlUploaderWindow(QMainWindow):
         # Move the window
         self.move(x, y)
 
+    def closeEvent(self, event):
+        """Stop running work, then release pooled connections and close the databases"""
+        if self.folder_watcher:
+            self.folder_watcher.stop()
+        threads = [thread for thread in (self.upload_thread, self.processing_thread, self.watch_thread)
+                   if thread and thread.isRunning()]
+        if self.upload_thread in threads:
+            # No result dialog while closing
+            self.upload_thread.finished.disconnect()
+            self.upload_status.setText("Finishing the uploads in progress...")
+        # Uploads in flight are completed and journaled, no new ones start
+        for thread in threads:
+            thread.cancel()
+        for thread in threads:
+            thread.wait()
+        # Searches still running are dropped with the loop, before the cache closes
+        self.async_loop.submit(self.async_tmdb.close()).result()
+        self.async_loop.stop()
+        
+        self.subdl.close()
+        self.upload_journal.close()
+        self.dedup_index.close()
+        self.parse_cache.close()
+        self.scan_index.close()
+        self.tmdb.close()
+        self.tmdb_cache.close()
+        super().closeEvent(event)
+
     def setup_search_tab(self):
         """Setup the search tab UI"""
         layout = QVBoxLayout(self.search_tab)
@@ -115,6 +206,17 @@ class SubdlUploaderWindow(QMainWindow):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Enter TV series name...")
         self.search_input.returnPressed.connect(self.perform_search)
+        self.search_input.textChanged.connect(self.schedule_search)
+        
+        # Search as you type, once typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.perform_search)
+        # Only the newest search may show its results
+        self.search_generation = 0
+        # Results of recent queries, lowercased query -> pages fetched so far
+        self.search_results = {}
         
         search_button = QPushButton("🔍 Search")
         search_button.clicked.connect(self.perform_search)
@@ -122,10 +224,14 @@ class SubdlUploaderWindow(QMainWindow):
         search_layout.addWidget(self.search_input)
         search_layout.addWidget(search_button)
         
-        # Results area setup
+        # Results area setup, more cards and pages are loaded near the bottom
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        scroll_area.verticalScrollBar().valueChanged.connect(self.check_results_scroll)
+        scroll_area.verticalScrollBar().rangeChanged.connect(self.check_results_scroll)
+        self.results_scroll = scroll_area
+        self.shown_search = None
         
         self.results_widget = QWidget()
         self.results_layout = QVBoxLayout(self.results_widget)
@@ -140,7 +246,7 @@ class SubdlUploaderWindow(QMainWindow):
         no_results_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         no_results_icon.setStyleSheet("font-size: 24px;")
         
-        self.no_results_label = QLabel("No TV series found.\nTry different keywords.")
+        self.no_results_label = QLabel(self.NO_RESULTS_TEXT)
         self.no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.no_results_label.setStyleSheet("""
             QLabel {
@@ -169,20 +275,93 @@ class SubdlUploaderWindow(QMainWindow):
         layout.addLayout(search_layout)
         layout.addWidget(scroll_area)
 
+    def schedule_search(self, text):
+        """Search while the user types, previewing from earlier results right away"""
+        query = text.strip()
+        if len(query) < self.SEARCH_MIN_LENGTH:
+            self.search_timer.stop()
+            return
+        if preview := self.cached_search_preview(query):
+            self.show_search_results(preview)
+        self.search_timer.start()
+
+    def cached_search_preview(self, query):
+        """Results for a query from memory, narrowed down from a shorter query if needed"""
+        key = query.lower()
+        if key in self.search_results:
+            return self.search_results[key]
+        words = key.split()
+        for length in range(len(key) - 1, self.SEARCH_MIN_LENGTH - 1, -1):
+            if (prefix := key[:length]) in self.search_results:
+                results = [
+                    show for show in self.search_results[prefix]['results']
+                    if all(word in show.get('name', '').lower() for word in words)
+                ]
+                # A preview never loads more pages, the real search follows
+                return {'query': query, 'results': results, 'page': 1, 'total_pages': 1} if results else None
+        return None
+
     def perform_search(self):
         """Execute TV series search"""
+        self.search_timer.stop()
         query = self.search_input.text().strip()
         if not query:
             return
         
-        # Clear previous results
-        for i in reversed(range(self.results_layout.count())): 
-            widget = self.results_layout.itemAt(i).widget()
-            if widget != self.no_results_widget:  # Keep the no results widget
-                widget.setParent(None)
+        # Any search still running is superseded by this one
+        self.search_generation += 1
+        generation = self.search_generation
+        if (key := query.lower()) in self.search_results:
+            self.show_search_results(self.search_results[key])
+            return
     
         # Show loading state
-        loading_widget = QLabel("🔄 Searching...", self)
+        loading_widget = self.create_loading_label("🔄 Searching...")
+        self.results_layout.insertWidget(0, loading_widget)
+        self.no_results_widget.hide()
+        
+        def handle_results(data):
+            # Remove loading indicator
+            loading_widget.setParent(None)
+            
+            # A failed request is not remembered, searching again asks TMDB again
+            if data.get('failed'):
+                if generation == self.search_generation:
+                    self.show_search_error("Could not reach TMDB.\nCheck your connection and search again.")
+                return
+            
+            data['query'] = query
+            self.search_results[key] = data
+            if len(self.search_results) > self.SEARCH_RESULTS_KEPT:
+                del self.search_results[next(iter(self.search_results))]
+            
+            # A newer query was typed meanwhile
+            if generation != self.search_generation:
+                return
+            self.show_search_results(data)
+        
+        self.start_search(query, 1, handle_results)
+
+    def start_search(self, query, page, handle_results):
+        """Fetch a results page in the background, handle_results gets it on the GUI thread"""
+        self.run_async(self.async_tmdb.search_tv_series_page(query, page), handle_results)
+
+    def run_async(self, coro, on_result=None):
+        """Run a coroutine on the asyncio loop thread, on_result(result) is called on the GUI thread"""
+        future = self.async_loop.submit(coro)
+        future.add_done_callback(lambda future: self.async_result.emit(on_result, future))
+
+    def deliver_async_result(self, on_result, future):
+        try:
+            result = future.result()
+        except Exception:
+            logging.error("Background TMDB request failed", exc_info=True)
+            return
+        if on_result:
+            on_result(result)
+
+    def create_loading_label(self, text):
+        loading_widget = QLabel(text, self)
         loading_widget.setStyleSheet("""
             QLabel {
                 padding: 20px;
@@ -194,32 +373,91 @@ class SubdlUploaderWindow(QMainWindow):
                 margin: 20px;
             }
         """)
-        self.results_layout.insertWidget(0, loading_widget)
-        self.no_results_widget.hide()
+        return loading_widget
+
+    def show_search_results(self, data):
+        """Replace the result cards, only the first batch of cards is built now"""
+        # Clear previous results
+        for i in reversed(range(self.results_layout.count())): 
+            widget = self.results_layout.itemAt(i).widget()
+            if widget != self.no_results_widget:  # Keep the no results widget
+                widget.setParent(None)
         
-        # Create and start search thread (updated line)
-        self.search_thread = SearchThread(self.tmdb, query)
+        self.series_cards = []
+        self.shown_search = None
+        self.results_scroll.verticalScrollBar().setValue(0)
+        # failed stops paging after an error until the results are shown again
+        self.shown_search = {'data': data, 'built': 0, 'loading': None, 'failed': False}
+        if not data['results']:
+            self.no_results_label.setText(self.NO_RESULTS_TEXT)
+            self.no_results_widget.show()
+            return
         
-        def handle_results(results):
-            # Remove loading indicator
-            loading_widget.setParent(None)
-            
-            if not results:
-                self.no_results_widget.show()
+        # Hide no results widget and show results
+        self.no_results_widget.hide()
+        self.build_more_cards()
+
+    def show_search_error(self, text):
+        """Show an error in place of the results"""
+        self.show_search_results({'query': '', 'results': [], 'page': 1, 'total_pages': 1})
+        self.no_results_label.setText(text)
+
+    def build_more_cards(self):
+        """Add the next batch of result cards"""
+        state = self.shown_search
+        results = state['data']['results']
+        for show in results[state['built']:state['built'] + self.CARD_BATCH]:
+            card = SeriesCard(show, self.image_cache)
+            card.clicked.connect(self.handle_series_selection)
+            self.results_layout.addWidget(card)
+            self.series_cards.append(card)
+        state['built'] = min(len(results), state['built'] + self.CARD_BATCH)
+        # If the batch still fits in the viewport the scroll range does not
+        # change, so look again once the layout has settled
+        QTimer.singleShot(0, self.check_results_scroll)
+
+    def check_results_scroll(self, *args):
+        """Build more cards, or fetch the next page, once the bottom is within a screen"""
+        state = self.shown_search
+        if not state or state['loading']:
+            return
+        bar = self.results_scroll.verticalScrollBar()
+        if bar.maximum() - bar.value() > self.results_scroll.viewport().height():
+            return
+        
+        data = state['data']
+        if state['built'] < len(data['results']):
+            self.build_more_cards()
+        elif data['page'] < data['total_pages'] and not state['failed']:
+            self.load_next_page(state)
+
+    def load_next_page(self, state):
+        """Fetch the next results page of the shown search in the background"""
+        data = state['data']
+        state['loading'] = self.create_loading_label("🔄 Loading more...")
+        self.results_layout.addWidget(state['loading'])
+        
+        def handle_page(page_data):
+            state['loading'].setParent(None)
+            state['loading'] = None
+            if page_data.get('failed'):
+                # Stop paging instead of retrying on every scroll, the cached
+                # results keep their page count so showing them again retries
+                state['failed'] = True
+                if self.shown_search is state:
+                    self.results_layout.addWidget(
+                        self.create_loading_label("⚠️ Could not load more results, search again to retry")
+                    )
                 return
-            
-            # Hide no results widget and show results
-            self.no_results_widget.hide()
-            self.series_cards = []
-            for show in results:
-                card = SeriesCard(show, self.image_cache)
-                card.clicked.connect(self.handle_series_selection)
-                self.results_layout.addWidget(card)
-                self.series_cards.append(card)
-    
-        # Connect and start thread
-        self.search_thread.finished.connect(handle_results)
-        self.search_thread.start()
+            known = {show.get('id') for show in data['results']}
+            data['results'].extend(show for show in page_data['results'] if show.get('id') not in known)
+            data['page'] = page_data['page']
+            data['total_pages'] = page_data['total_pages']
+            # Results of another search are now shown, the pages stay cached
+            if self.shown_search is state:
+                self.check_results_scroll()
+        
+        self.start_search(data['query'], data['page'] + 1, handle_page)
 
     def handle_series_selection(self, series_data):
         """Handle series card selection"""
@@ -232,16 +470,23 @@ class SubdlUploaderWindow(QMainWindow):
         if isinstance(clicked_card, SeriesCard):
             clicked_card.set_selected(True)
     
-        # Store selected series info
-        self.selected_series = {
-            'tmdb_id': series_data['id'],
-            'name': series_data['name']
-        }
+        # The series applies to the groups of the selected rows, or to the only group
+        records = [self.queue_model.records[row] for row in self.selected_rows()]
+        if not records and len(self.queue_index.groups) == 1:
+            records = self.queue_model.records[:1]
+        if not records and self.queue_model.records:
+            QMessageBox.information(
+                self, "Select Files",
+                "Select files of this series in the upload queue, then choose the series again."
+            )
         
-        # Update the selected series label
-        self.selected_series_label.setText(
-            f"Selected Series: {series_data['name']} (TMDB ID: {series_data['id']})"
-        )
+        match = {'tmdb_id': series_data['id'], 'name': series_data['name'], 'confidence': 1.0}
+        if not records and not self.queue_index:
+            self.preselected_match = match
+        for series, title in {record.series: record.title for record in records}.items():
+            self.series_resolver.remember(title, match)
+            self.queue_model.set_match(series, match, force=True)
+        self.update_series_summary()
         
         self.tab_widget.setCurrentWidget(self.upload_tab)
 
@@ -303,6 +548,11 @@ class SubdlUploaderWindow(QMainWindow):
         self.resume_button.setEnabled(False)
         self.cancel_button.setEnabled(False)
         
+        # Connected once, they act on whichever upload is running
+        self.pause_button.clicked.connect(self.pause_upload)
+        self.resume_button.clicked.connect(self.resume_upload)
+        self.cancel_button.clicked.connect(self.cancel_upload)
+        
         control_buttons.addWidget(self.pause_button)
         control_buttons.addWidget(self.resume_button)
         control_buttons.addWidget(self.cancel_button)
@@ -335,28 +585,39 @@ class SubdlUploaderWindow(QMainWindow):
         select_files_button = QPushButton("📁 Select Files", self)
         select_files_button.clicked.connect(self.add_files)
         
+        # Watch the folders from settings and queue new files as they appear
+        self.watch_button = QPushButton("👁 Watch Folders", self)
+        self.watch_button.setCheckable(True)
+        self.watch_button.toggled.connect(self.toggle_folder_watch)
+        
         files_layout.addWidget(self.drag_label)
         files_layout.addWidget(select_files_button)
+        files_layout.addWidget(self.watch_button)
         files_layout.addStretch()
         
         layout.addLayout(files_layout)
         
         # Create and setup table
-        self.table = DragDropTable(0, 4, self)  # Changed from 5 to 4 columns
-        self.table.setHorizontalHeaderLabels([
-            "Season", "Episode", "Title", "Filename"  # Removed Release Group
-        ])
+        self.queue_model = UploadQueueModel(self)
+        self.table = DragDropTable(self)
+        self.table.setModel(self.queue_model)
         
         # Set column widths
         self.table.setColumnWidth(0, 70)   # Season
         self.table.setColumnWidth(1, 70)   # Episode
         self.table.setColumnWidth(2, 200)  # Title
+        self.table.setColumnWidth(3, 220)  # Series
         self.table.horizontalHeader().setStretchLastSection(True)  # Filename
         
         # Enable multiple selection
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
+        self.table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.verticalHeader().setVisible(True)
+        # Fixed row heights keep scrolling cheap with very long queues
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(self.table.fontMetrics().height() + 8)
         self.table.file_dropped.connect(self.process_files)
+        self.table.doubleClicked.connect(self.review_series)
         
         layout.addWidget(self.table)
 
@@ -399,6 +660,29 @@ class SubdlUploaderWindow(QMainWindow):
         upload_layout.addRow("Default Framerate:", self.default_framerate)
         upload_layout.addRow("Default Comment:", self.default_comment)
         
+        # Number of subtitles uploaded at the same time
+        self.upload_workers = QSpinBox()
+        self.upload_workers.setRange(1, 10)
+        self.upload_workers.setValue(4)
+        upload_layout.addRow("Concurrent Uploads:", self.upload_workers)
+        
+        # Skip byte-identical copies of subtitles that were uploaded before
+        self.skip_duplicates = QCheckBox("Skip subtitles that were already uploaded")
+        self.skip_duplicates.setChecked(True)
+        upload_layout.addRow("Duplicates:", self.skip_duplicates)
+        
+        # Submit each season's files together as one full-season subtitle
+        self.season_packs = QCheckBox("Upload each season as a single full-season pack")
+        upload_layout.addRow("Season Packs:", self.season_packs)
+        
+        # Transcode legacy code page and UTF-16 subtitles before sending them
+        self.normalize_encoding = QCheckBox("Convert cp1256 and UTF-16 subtitles to UTF-8 before uploading")
+        upload_layout.addRow("Encoding:", self.normalize_encoding)
+        
+        # Only list changed folders and queue new or modified files when re-adding a folder
+        self.incremental_scan = QCheckBox("Only add files that are new or changed since the last scan")
+        upload_layout.addRow("Folder Rescans:", self.incremental_scan)
+        
         # Add releases template group
         releases_group = QGroupBox("Release Names Templates")
         releases_layout = QVBoxLayout(releases_group)
@@ -416,9 +700,26 @@ class SubdlUploaderWindow(QMainWindow):
         self.releases_template.setPlaceholderText("Enter release names...")
         releases_layout.addWidget(self.releases_template)
         
+        # Add watch folders group
+        watch_group = QGroupBox("Watch Folders")
+        watch_layout = QVBoxLayout(watch_group)
+        
+        watch_desc = QLabel("Folders watched for new subtitles (one per line).")
+        watch_desc.setStyleSheet("color: #666;")
+        watch_layout.addWidget(watch_desc)
+        
+        self.watch_folders = QTextEdit()
+        self.watch_folders.setPlaceholderText("Enter folder paths...")
+        self.watch_folders.setMaximumHeight(80)
+        watch_layout.addWidget(self.watch_folders)
+        
+        self.watch_auto_upload = QCheckBox("Upload watched files to the selected series automatically")
+        watch_layout.addWidget(self.watch_auto_upload)
+        
         # Add to main layout
         layout.addWidget(api_group)
         layout.addWidget(upload_group)
+        layout.addWidget(watch_group)
         layout.addWidget(releases_group)
         
         # Add save button with styling
@@ -441,17 +742,27 @@ class SubdlUploaderWindow(QMainWindow):
 
     def save_settings(self):
         """Save settings to file"""
-        settings = {
+        # Keep keys that have no widget (e.g. connection pool tuning)
+        settings = dict(self.settings)
+        settings.update({
             'tmdb_api_key': self.tmdb_api_key.text(),
             'subdl_api_key': self.subdl_api_key.text(),
             'default_language': self.default_language.currentData(),
             'default_framerate': self.default_framerate.currentText(),
             'default_comment': self.default_comment.toPlainText(),
+            'upload_workers': self.upload_workers.value(),
+            'skip_duplicates': self.skip_duplicates.isChecked(),
+            'season_packs': self.season_packs.isChecked(),
+            'normalize_encoding': self.normalize_encoding.isChecked(),
+            'incremental_scan': self.incremental_scan.isChecked(),
+            'watch_folders': self.watch_folders.toPlainText().splitlines(),
+            'watch_auto_upload': self.watch_auto_upload.isChecked(),
             'releases_template': self.releases_template.toPlainText().splitlines()
-        }
+        })
         
         with open('settings.json', 'w') as f:
             json.dump(settings, f, indent=4)
+        self.settings = settings
         
         QMessageBox.information(self, "Settings Saved", 
                           "Settings have been saved successfully.")
@@ -464,6 +775,13 @@ class SubdlUploaderWindow(QMainWindow):
             'default_language': 'EN',
             'default_framerate': '23.976',
             'default_comment': '',
+            'upload_workers': 4,
+            'skip_duplicates': True,
+            'season_packs': False,
+            'normalize_encoding': False,
+            'incremental_scan': False,
+            'watch_folders': [],
+            'watch_auto_upload': False,
             'releases_template': []
         }
         
@@ -482,6 +800,13 @@ class SubdlUploaderWindow(QMainWindow):
                 
             self.default_framerate.setCurrentText(settings.get('default_framerate', '23.976'))
             self.default_comment.setText(settings.get('default_comment', ''))
+            self.upload_workers.setValue(settings.get('upload_workers', 4))
+            self.skip_duplicates.setChecked(settings.get('skip_duplicates', True))
+            self.season_packs.setChecked(settings.get('season_packs', False))
+            self.normalize_encoding.setChecked(settings.get('normalize_encoding', False))
+            self.incremental_scan.setChecked(settings.get('incremental_scan', False))
+            self.watch_folders.setText('\n'.join(settings.get('watch_folders', [])))
+            self.watch_auto_upload.setChecked(settings.get('watch_auto_upload', False))
             self.releases_template.setText('\n'.join(settings.get('releases_template', [])))
             
             return settings
@@ -489,56 +814,53 @@ class SubdlUploaderWindow(QMainWindow):
         except (FileNotFoundError, json.JSONDecodeError):
             return default_settings
 
+    def selected_rows(self):
+        """Sorted row numbers of the selected queue rows"""
+        return sorted(set(index.row() for index in self.table.selectionModel().selectedIndexes()))
+
+    def select_rows(self, rows):
+        """Replace the selection with whole rows"""
+        selection = self.table.selectionModel()
+        selection.clearSelection()
+        for row in rows:
+            selection.select(
+                self.queue_model.index(row, 0),
+                selection.SelectionFlag.Select | selection.SelectionFlag.Rows
+            )
+
     def delete_selected_rows(self):
         """Delete all selected rows from the table"""
-        rows = sorted(set(item.row() for item in self.table.selectedItems()), reverse=True)
-        for row in rows:
-            file_path = self.table.item(row, 3).data(Qt.ItemDataRole.UserRole)
-            self.added_files.remove(file_path)  # Remove from tracking set
-            self.table.removeRow(row)
+        for record in self.queue_model.remove_rows(self.selected_rows()):
+            self.queue_index.discard(record)  # Remove from tracking index
             
         # If table is empty, reset series selection
-        if self.table.rowCount() == 0:
-            self.clear_series_selection()
-            self.added_files.clear()  # Clear the tracking set
+        if self.queue_model.rowCount() == 0 and not self.pending_rows:
+            self.queue_index.clear()  # Clear the tracking index
+        self.update_series_summary()
 
     def move_rows_up(self):
         """Move selected rows up one position"""
-        rows = sorted(set(item.row() for item in self.table.selectedItems()))
+        rows = self.selected_rows()
         if not rows or rows[0] <= 0:
             return
             
         for row in rows:
-            for col in range(self.table.columnCount()):
-                current = self.table.takeItem(row, col)
-                above = self.table.takeItem(row - 1, col)
-                self.table.setItem(row - 1, col, current)
-                self.table.setItem(row, col, above)
+            self.queue_model.move_row(row, row - 1)
             
         # Update selection
-        self.table.clearSelection()
-        for row in rows:
-            for col in range(self.table.columnCount()):
-                self.table.item(row - 1, col).setSelected(True)
+        self.select_rows(row - 1 for row in rows)
 
     def move_rows_down(self):
         """Move selected rows down one position"""
-        rows = sorted(set(item.row() for item in self.table.selectedItems()), reverse=True)
-        if not rows or rows[-1] >= self.table.rowCount() - 1:
+        rows = self.selected_rows()[::-1]
+        if not rows or rows[0] >= self.queue_model.rowCount() - 1:
             return
             
         for row in rows:
-            for col in range(self.table.columnCount()):
-                current = self.table.takeItem(row, col)
-                below = self.table.takeItem(row + 1, col)
-                self.table.setItem(row + 1, col, current)
-                self.table.setItem(row, col, below)
+            self.queue_model.move_row(row, row + 1)
             
         # Update selection
-        self.table.clearSelection()
-        for row in rows:
-            for col in range(self.table.columnCount()):
-                self.table.item(row + 1, col).setSelected(True)
+        self.select_rows(row + 1 for row in rows)
 
     def add_files(self):
         """Open file dialog and add selected subtitle files to the table"""
@@ -551,113 +873,148 @@ class SubdlUploaderWindow(QMainWindow):
         self.process_files(files)
     
     def process_files(self, files):
-        """Process list of files and check for multiple series"""
-        all_files = []
-        detected_series = set()
+        """Scan and process files and folders and check for multiple series"""
+        if not files:
+            return
+        # A cancelled scan closes its dialog but stops only between chunks
+        if self.processing_thread and self.processing_thread.isRunning():
+            QMessageBox.information(self, "Busy", "The previous scan is still stopping, try again in a moment.")
+            return
         
-        # Update file extensions in directory scanning
-        for file_path in files:
-            if Path(file_path).is_dir():
-                all_files.extend([str(f) for f in Path(file_path).rglob('*') 
-                                if f.suffix.lower() in ('.srt', '.sup', '.ass')])  
-            elif Path(file_path).suffix.lower() in ('.srt', '.sup', '.ass'):  
-                all_files.append(file_path)
-
         # Create progress dialog
-        processing_dialog = QProgressDialog("Processing files...", None, 0, 100, self)
+        processing_dialog = QProgressDialog("Scanning files...", "Cancel", 0, 0, self)
         processing_dialog.setWindowTitle("Processing")
         processing_dialog.setWindowModality(Qt.WindowModality.WindowModal)
         processing_dialog.setMinimumDuration(0)
-        processing_dialog.setCancelButton(None)
         processing_dialog.setAutoClose(False)
+        processing_dialog.setAutoReset(False)
     
-        # Create processing thread with config
-        self.processing_thread = FileProcessingThread(all_files)
+        # Create processing thread with config, folders are scanned in the thread
+        thread = FileProcessingThread(
+            files, self.dedup_index if self.skip_duplicates.isChecked() else None,
+            self.parse_cache, self.settings.get('scan_exclude', EXCLUDED_DIRS),
+            self.scan_index if self.incremental_scan.isChecked() else None
+        )
+        self.processing_thread = thread
+        processing_dialog.canceled.connect(thread.cancel)
     
-        def handle_file_processed(file_path, file_info):
-            """Handle each processed file immediately"""
-            # First check if we have files in table already
-            if self.table.rowCount() > 0:
-                existing_series = self.table.item(0, 2).text().lower()  # Get first series title
-                new_series = file_info['title'].lower()
-                
-                # If new file is from a different series, show warning and stop
-                if existing_series != new_series:
-                    processing_dialog.close()
-                    QMessageBox.warning(
-                        self,
-                        "Different Series Detected",
-                        f"Cannot add files from a different series!\n\n"
-                        f"Current series: {existing_series}\n"
-                        f"New file series: {new_series}",
-                        QMessageBox.StandardButton.Ok
-                    )
-                    return
-
-            # If we get here, either table is empty or series matches
-            if file_path not in self.added_files:
-                self.add_file_to_table(file_path, file_info)
-                self.added_files.add(file_path)
-
         def handle_detection_complete(series_set):
             """Handle completion of file processing"""
+            self.flush_pending_rows()
             processing_dialog.close()
+            # A pre-selected series covers one drop
+            self.preselected_match = None
+            self.update_series_summary()
             
-            # Auto search for series if not already selected
-            if not self.selected_series and self.table.rowCount() > 0:
-                first_title = self.table.item(0, 2).text()
-                if first_title:
-                    self.search_input.setText(first_title)
-                    self.tab_widget.setCurrentWidget(self.search_tab)
-                    self.perform_search()
+            notes = []
+            if thread.failed:
+                notes.append("Scanning stopped after an error, see the log")
+            if skipped := thread.skipped_duplicates:
+                notes.append(f"Skipped {skipped} already uploaded file(s)")
+            if invalid := thread.invalid:
+                notes.append(f"{invalid} invalid file(s) will not be uploaded")
+            if notes:
+                self.upload_status.setText(", ".join(notes))
+        
+        def handle_progress(text, value):
+            """Update the dialog, a negative value means the total is not known yet"""
+            processing_dialog.setLabelText(text)
+            if value < 0:
+                processing_dialog.setRange(0, 0)
+            else:
+                processing_dialog.setRange(0, 100)
+                processing_dialog.setValue(value)
         
         # Connect signals
-        self.processing_thread.progress.connect(
-            lambda text, value: (
-                processing_dialog.setLabelText(text),
-                processing_dialog.setValue(value)
-            )
-        )
-        self.processing_thread.file_processed.connect(handle_file_processed)
-        self.processing_thread.detection_complete.connect(handle_detection_complete)
+        thread.progress.connect(handle_progress)
+        thread.files_processed.connect(self.queue_records)
+        thread.detection_complete.connect(handle_detection_complete)
         
         # Start processing
-        self.processing_thread.start()
+        thread.start()
         processing_dialog.exec()
 
-    def add_processed_file(self, file_path, file_info):
-        """Add a processed file to the table"""
-        if file_path not in self.added_files:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Add items to row
-            self.table.setItem(row, 0, QTableWidgetItem(file_info['season']))
-            self.table.setItem(row, 1, QTableWidgetItem(file_info['episode']))
-            self.table.setItem(row, 2, QTableWidgetItem(file_info['title']))
-            
-            # Add filename with full path stored in UserRole
-            filename_item = QTableWidgetItem(file_info['filename'])
-            filename_item.setData(Qt.ItemDataRole.UserRole, file_path)
-            self.table.setItem(row, 3, filename_item)
-            
-            # Auto-resize rows
-            self.table.resizeRowsToContents()
+    def queue_records(self, batch):
+        """Buffer a batch of processed files, insertion is coalesced by a timer"""
+        for record in batch:
+            if self.queue_index.add(record):
+                self.pending_rows.append(record)
+        if self.pending_rows and not self.table_refresh_timer.isActive():
+            self.table_refresh_timer.start()
+
+    def resolve_series(self, records):
+        """Look up the TMDB series of new title groups in the background"""
+        titles = {}
+        for record in records:
+            if record.confidence is None and record.series not in self.resolving:
+                titles.setdefault(record.series, record.title)
+        if not titles:
+            return
+        self.resolving.update(titles)
+        
+        # Every title is searched at once on the asyncio loop
+        self.run_async(self.series_resolver.resolve_many_async(
+            list(titles.values()), self.series_resolved.emit,
+            lambda title, error: self.series_lookup_failed.emit(title)
+        ))
+
+    def handle_series_resolved(self, title, match):
+        series = title.lower()
+        self.resolving.discard(series)
+        self.queue_model.set_match(series, match)
+        self.update_series_summary()
+        if self.watch_auto_upload.isChecked() and self.folder_watcher:
+            self.auto_upload_watched()
 
-    def upload_file(self, file_path, tmdb_id, season, releases, language_id):
-        return self.subdl.upload_subtitle(
-            file_path, tmdb_id, season, releases, language_id
+    def handle_series_lookup_failed(self, title):
+        """TMDB could not be reached, the group stays unresolved and is looked up again later"""
+        self.resolving.discard(title.lower())
+        self.upload_status.setText(f"TMDB search for \"{title}\" failed, retrying shortly")
+        QTimer.singleShot(self.RESOLVE_RETRY_MS, lambda: self.resolve_series(self.queue_model.records))
+
+    def review_series(self, index):
+        """Search TMDB for the title of a double-clicked row to pick its series"""
+        record = self.queue_model.records[index.row()]
+        self.select_rows(
+            row for row, other in enumerate(self.queue_model.records) if other.series == record.series
         )
+        self.search_input.setText(record.title)
+        self.tab_widget.setCurrentWidget(self.search_tab)
+        self.perform_search()
 
-    def clear_series_selection(self):
-        """Clear the selected series"""
-        self.selected_series = None
-        self.selected_series_label.setText("No series selected")
+    def update_series_summary(self):
+        """Show the series of the queue, or how many there are and how many need review"""
+        groups = self.queue_index.groups
+        matches = self.queue_model.matches
+        review = sum(
+            1 for series in groups
+            if series in matches and needs_review(matches[series])
+        )
+        
+        if not groups and (match := self.preselected_match):
+            self.selected_series_label.setText(
+                f"Selected Series: {match['name']} (TMDB ID: {match['tmdb_id']}), used for the files added next"
+            )
+        elif not groups:
+            self.selected_series_label.setText("No series selected")
+        elif len(groups) == 1 and not review and (match := matches.get(next(iter(groups)))):
+            self.selected_series_label.setText(
+                f"Selected Series: {match['name']} (TMDB ID: {match['tmdb_id']})"
+            )
+        else:
+            text = f"{len(groups)} series in queue"
+            if review:
+                text += f", {review} to review (double-click a row)"
+            self.selected_series_label.setText(text)
 
     def upload_subtitles(self):
         """Handle subtitle upload process with visual feedback"""
-        if not self.selected_series or self.table.rowCount() == 0:
-            QMessageBox.warning(self, "Error", "No series selected or no subtitles added!")
+        if self.uploading:
+            # Its files would be sent twice by a second upload
+            QMessageBox.information(self, "Busy", "An upload is already running.")
+            return
+        if self.queue_model.rowCount() == 0:
+            QMessageBox.warning(self, "Error", "No subtitles added!")
             return
 
         # Validate all required settings
@@ -696,6 +1053,37 @@ class SubdlUploaderWindow(QMainWindow):
                 return
             return
 
+        # Every file goes to the series of its group, doubtful matches are confirmed first
+        # Files that failed validation are never sent
+        records = [record for record in self.queue_model.records if not record.problem]
+        if not records:
+            QMessageBox.warning(self, "Error", "All queued subtitles are invalid!")
+            return
+        unresolved = sum(1 for record in records if record.tmdb_id is None)
+        review = sum(1 for record in records if record.tmdb_id is not None and record.needs_review)
+        if unresolved or review:
+            message = []
+            if unresolved:
+                message.append(f"{unresolved} file(s) have no series yet and will be skipped.")
+            if review:
+                message.append(f"{review} file(s) have low-confidence series matches (marked ⚠).")
+            if QMessageBox.question(
+                self,
+                "Review Series",
+                "\n".join(message) + "\n\nUpload anyway?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            ) != QMessageBox.StandardButton.Yes:
+                return
+        records = [record for record in records if record.tmdb_id is not None]
+        if not records:
+            return
+
+        self.start_upload(records)
+
+    def start_upload(self, records, quiet=False):
+        """Upload the given queue records, quiet reports the result without dialogs"""
+        self.uploading = True
+        
         # Update controls state
         self.upload_status.setText("Uploading subtitles...")
         self.upload_progress.setText("0/0 files processed")
@@ -705,117 +1093,190 @@ class SubdlUploaderWindow(QMainWindow):
         
         # Prepare upload data
         files_data = []
-        for row in range(self.table.rowCount()):
-            file_path = self.table.item(row, 3).data(Qt.ItemDataRole.UserRole)
-            season = self.table.item(row, 0).text()
-            episode = self.table.item(row, 1).text()
+        # Rows may be deleted or moved during the upload, so progress follows records
+        for record in records:
+            season = record.season
+            episode = record.episode
             
             files_data.append({
-                'file_path': file_path,
-                'tmdb_id': self.selected_series['tmdb_id'],
+                'file_path': record.path,
+                'tmdb_id': record.tmdb_id,
                 'season': season,
-                'releases': self.process_release_templates(season, episode, os.path.basename(file_path)),
+                'releases': self.process_release_templates(season, episode, record.filename),
                 'language': self.default_language.currentData(),
                 'comment': self.default_comment.toPlainText(),
                 'framerate': self.FRAMERATE_MAP[self.default_framerate.currentText()],
                 'episode': episode
             })
     
-        # Create and setup upload thread
-        self.upload_thread = UploadThread(self.subdl, files_data)
+        # Create and setup upload thread, watched files arrive a few at a
+        # time and are never a whole season, so they are not sent as packs
+        upload_thread = UploadThread(
+            self.subdl, files_data, self.upload_workers.value(), self.upload_journal,
+            self.dedup_index, self.skip_duplicates.isChecked(),
+            self.season_packs.isChecked() and not quiet, self.normalize_encoding.isChecked(),
+            self.settings.get('legacy_encoding', DEFAULT_LEGACY_ENCODING), self.scan_index, self.tmdb
+        )
+        self.upload_thread = upload_thread
+        finished_rows = set()
     
         def handle_progress(row, status, color):
-            self.upload_progress.setText(f"{row + 1}/{len(files_data)} files processed")
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item:
-                    item.setBackground(QColor(color))
-            filename_item = self.table.item(row, 3)
-            if filename_item:
-                orig_name = os.path.basename(filename_item.data(Qt.ItemDataRole.UserRole))
-                filename_item.setText(f"{orig_name} ({status})")
+            if not status.startswith(("Processing", "Uploading")):
+                finished_rows.add(row)
+            self.upload_progress.setText(f"{len(finished_rows)}/{len(files_data)} files processed")
+            self.queue_model.set_status(records[row], status, color)
     
-        def handle_finished(success):
+        def handle_finished():
+            # QThread.finished comes once run() has returned, so the next
+            # upload can safely replace this thread
+            success = upload_thread.success
             # Reset controls state
+            self.uploading = False
             self.upload_status.setText("Ready")
             self.upload_progress.setText("")
             self.pause_button.setEnabled(False)
             self.resume_button.setEnabled(False)
             self.cancel_button.setEnabled(False)
             
-            if success:
+            if quiet:
+                self.upload_status.setText(
+                    "Watched files uploaded" if success else "Some watched files failed to upload"
+                )
+            elif success:
                 QMessageBox.information(self, "Success", "All subtitles uploaded successfully!")
             else:
                 QMessageBox.warning(self, "Warning", "Some files failed to upload.")
+            
+            # Files queued by the watcher during this upload go next
+            if self.auto_upload_requested:
+                self.auto_upload_watched()
     
-        # Connect signals and buttons
-        self.upload_thread.progress.connect(handle_progress)
-        self.upload_thread.finished.connect(handle_finished)
+        # Connect signals
+        upload_thread.progress.connect(handle_progress)
+        upload_thread.finished.connect(handle_finished)
         
-        self.pause_button.clicked.connect(lambda: (
-            self.upload_thread.pause(),
-            self.pause_button.setEnabled(False),
+        # Start upload
+        upload_thread.start()
+
+    def pause_upload(self):
+        if self.uploading:
+            self.upload_thread.pause()
+            self.pause_button.setEnabled(False)
             self.resume_button.setEnabled(True)
-        ))
-        
-        self.resume_button.clicked.connect(lambda: (
-            self.upload_thread.resume(),
-            self.pause_button.setEnabled(True),
+
+    def resume_upload(self):
+        if self.uploading:
+            self.upload_thread.resume()
+            self.pause_button.setEnabled(True)
             self.resume_button.setEnabled(False)
-        ))
+
+    def cancel_upload(self):
+        if self.uploading:
+            self.upload_thread.cancel()
+
+    def toggle_folder_watch(self, checked):
+        """Start or stop watching the folders from settings"""
+        if not checked:
+            if self.folder_watcher:
+                self.folder_watcher.stop()
+                self.folder_watcher = None
+            self.upload_status.setText("Ready")
+            return
         
-        self.cancel_button.clicked.connect(self.upload_thread.cancel)
+        folders = [f for f in self.watch_folders.toPlainText().splitlines() if os.path.isdir(f)]
+        if not folders:
+            folder = QFileDialog.getExistingDirectory(self, "Select Folder to Watch")
+            if not folder:
+                self.watch_button.setChecked(False)
+                return
+            folders = [folder]
+            self.watch_folders.setText('\n'.join(self.watch_folders.toPlainText().splitlines() + [folder]))
         
-        # Start upload
-        self.upload_thread.start()
+        self.folder_watcher = FolderWatcher(
+            folders, self.settings.get('scan_exclude', EXCLUDED_DIRS),
+            self.settings.get('watch_polling', False), self
+        )
+        self.folder_watcher.files_ready.connect(self.queue_watched_files)
+        self.folder_watcher.start()
+        self.upload_status.setText(f"Watching {len(folders)} folder(s)")
 
-    def add_file_to_table(self, file_path, file_info):
-        """Add a subtitle file to the table with parsed information"""
-        if file_path not in self.added_files:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Add items to row
-            self.table.setItem(row, 0, QTableWidgetItem(file_info['season']))
-            self.table.setItem(row, 1, QTableWidgetItem(file_info['episode']))
-            self.table.setItem(row, 2, QTableWidgetItem(file_info['title']))
-            
-            # Add filename with full path stored in UserRole
-            filename_item = QTableWidgetItem(file_info['filename'])
-            filename_item.setData(Qt.ItemDataRole.UserRole, file_path)
-            self.table.setItem(row, 3, filename_item)
-            
-            # Auto-resize rows
-            self.table.resizeRowsToContents()
+    def queue_watched_files(self, files):
+        """Parse files found by the folder watcher and queue them without a dialog"""
+        if self.watch_thread and self.watch_thread.isRunning():
+            self.watch_backlog.extend(files)
+            return
+        
+        self.watch_thread = FileProcessingThread(
+            files, self.dedup_index if self.skip_duplicates.isChecked() else None,
+            self.parse_cache
+        )
+        
+        def handle_detection_complete(series_set):
+            self.flush_pending_rows()
+            if self.watch_auto_upload.isChecked():
+                self.auto_upload_watched()
+        
+        def handle_thread_finished():
+            if self.watch_backlog:
+                files, self.watch_backlog = self.watch_backlog, []
+                self.queue_watched_files(files)
+        
+        self.watch_thread.files_processed.connect(self.queue_watched_records)
+        self.watch_thread.detection_complete.connect(handle_detection_complete)
+        self.watch_thread.finished.connect(handle_thread_finished)
+        self.watch_thread.start()
+
+    def queue_watched_records(self, batch):
+        """Queue records found by the folder watcher, only those are auto-uploaded"""
+        for record in batch:
+            record.watched = True
+        self.queue_records(batch)
+
+    def auto_upload_watched(self):
+        """Upload the watched files that were not uploaded yet, without dialogs"""
+        if self.uploading:
+            self.auto_upload_requested = True
+            return
+        self.auto_upload_requested = False
+        
+        # Files without a confident series wait for review, files added by hand
+        # wait for the Upload button
+        records = [
+            record for record in self.queue_model.records
+            if record.watched and not record.uploaded and not record.problem
+            and record.tmdb_id is not None and not record.needs_review
+        ]
+        if not records:
+            return
+        if not (self.default_language.currentData() and self.default_framerate.currentText()
+                and self.default_comment.toPlainText().strip()):
+            self.upload_status.setText("Set language, framerate and comment to upload watched files")
+            return
+        self.start_upload(records, quiet=True)
+
+    def add_files_to_table(self, records):
+        """Append many queue records with a single model update"""
+        self.queue_model.append_records(records)
+        if match := self.preselected_match:
+            # Added by hand after picking a series, so no lookup is needed
+            picked = {record.series: record.title for record in records if not record.watched}
+            for series, title in picked.items():
+                self.series_resolver.remember(title, match)
+                self.queue_model.set_match(series, match, force=True)
+        self.resolve_series(records)
+        self.update_series_summary()
+
+    def flush_pending_rows(self):
+        """Insert every buffered file into the table"""
+        self.table_refresh_timer.stop()
+        rows, self.pending_rows = self.pending_rows, []
+        if rows:
+            self.add_files_to_table(rows)
 
     def process_release_templates(self, season, episode, filename):
         """Process release templates and replace season/episode patterns"""
         templates = self.releases_template.toPlainText().splitlines()
-        processed_releases = []
-        
-        # Format season and episode numbers with proper padding
-        season_digits = 3 if int(season) > 99 else 2
-        episode_digits = 3 if int(episode) > 99 else 2
-        
-        season_str = str(season).zfill(season_digits)
-        episode_str = str(episode).zfill(episode_digits)
-        
-        # Define season/episode patterns to replace
-        patterns = [
-            'S00E00',                    # Basic pattern
-            f'S\\d{{2,3}}E\\d{{2,3}}',  # Handles both 2 and 3 digit formats
-        ]
-        
-        for template in templates:
-            if template.strip():
-                release = template
-                # Replace all patterns with actual season/episode
-                for pattern in patterns:
-                    import re
-                    release = re.sub(pattern, f'S{season_str}E{episode_str}', release)
-                processed_releases.append(release)
-    
-        return processed_releases if processed_releases else [filename]  # fallback to filename if no templates
+        return process_release_templates(templates, season, episode, filename)
 
 class SeriesCard(QWidget):
     clicked = pyqtSignal(dict)
@@ -1262,103 +1723,257 @@ class UploadOptionsDialog(QDialog):
 
 class FileProcessingThread(QThread):
     progress = pyqtSignal(str, int)
-    file_processed = pyqtSignal(str, dict)
+    files_processed = pyqtSignal(list)  # [QueueRecord, ...]
     detection_complete = pyqtSignal(set)
     
-    def __init__(self, files): 
+    # Files per chunk sent to a parser process
+    CHUNK_SIZE = 64
+    # Fewer uncached files are parsed in this thread, a pool round trip would cost more
+    PARALLEL_THRESHOLD = 128
+    # A chunk is handed over after this many seconds even if it is not full
+    CHUNK_WAIT = 0.25
+    
+    def __init__(self, paths, dedup_index=None, parse_cache=None, excluded=EXCLUDED_DIRS,
+                 scan_index=None):
         super().__init__()
-        self.files = files
+        self.paths = paths
+        self.excluded = excluded
+        self.scan_index = scan_index
+        self.dedup_index = dedup_index
+        self.parse_cache = parse_cache
+        self.skipped_duplicates = 0
+        self.invalid = 0
+        self.failed = False
+        self.is_cancelled = False
     
-    def process_single_file(self, file_path):
-        """Process a single file and return its info"""
-        filename = os.path.basename(file_path)
-        try:
-            # Use stored config file
-            guess = guessit(filename)
-            if title := guess.get('title'):
-                file_info = {
-                    'season': str(guess.get('season', '')),
-                    'episode': str(guess.get('episode', '')),
-                    'title': title,
-                    'filename': filename
-                }
-                return title.lower(), file_info
-        except Exception as e:
-            logging.error(f"Error processing file {filename}: {e}")
-        return None, None
+    def cancel(self):
+        self.is_cancelled = True
         
     def run(self):
-        detected_series = set()
-        total = len(self.files)
-        
-        # Process files one by one
-        for index, file_path in enumerate(self.files):
-            progress = int((index/total) * 100)
-            self.progress.emit(f"Processing: {os.path.basename(file_path)}", progress)
+        self.detected_series = set()
+        try:
+            self.process()
+        except Exception:
+            logging.error("File processing failed", exc_info=True)
+            self.failed = True
+            self.is_cancelled = True
+        finally:
+            # Always sent, it closes the progress dialog
+            self.detection_complete.emit(self.detected_series)
+    
+    def process(self):
+        self.done = 0
+        self.found = 0
+        self.scanning = True
+        self.pool = None
+        self.pool_failed = False
+        
+        # Backpressure: at most this many chunks are parsed ahead of the UI
+        max_in_flight = PARSER_WORKERS * 2
+        in_flight = deque()
+        
+        # Files stream in from the scanner while it is still walking folders
+        files = scan_subtitle_files(self.paths, self.excluded, lambda: self.is_cancelled, self.scan_index)
+        for chunk in self.chunks(files):
+            if self.is_cancelled:
+                break
+            self.found += len(chunk)
+            size = len(chunk)
+            chunk, cached, to_parse = self.prepare_chunk(chunk)
             
-            series, file_info = self.process_single_file(file_path)
-            if series and file_info:
-                detected_series.add(series)
-                self.file_processed.emit(file_path, file_info)
+            # Small drops are parsed and validated right here, a pool round trip would cost more
+            if not self.pool and not self.pool_failed and self.found >= self.PARALLEL_THRESHOLD:
+                self.pool = get_parser_pool()
+            if not chunk:
+                future = None
+            elif self.pool:
+                try:
+                    future = self.pool.submit(process_subtitle_batch, to_parse, chunk)
+                except BrokenProcessPool:
+                    self.discard_pool()
+                    future = self.parse_here(to_parse, chunk)
+            else:
+                future = self.parse_here(to_parse, chunk)
+            in_flight.append((size, chunk, future, cached))
             
-            # Small delay to keep UI responsive
-            QThread.msleep(10)
-        
-        # Emit final series detection results
-        self.detection_complete.emit(detected_series)
+            # Waiting for the oldest chunk also keeps results in drop order
+            while in_flight and (len(in_flight) >= max_in_flight or
+                                 not in_flight[0][2] or in_flight[0][2].done()):
+                self.emit_chunk(*in_flight.popleft())
+        
+        self.scanning = False
+        while in_flight and not self.is_cancelled:
+            self.emit_chunk(*in_flight.popleft())
+        for size, chunk, future, cached in in_flight:
+            if future:
+                future.cancel()
+        
+        logging.info(f"Processed {self.done} files, {FAST_PATH_STATS}")
+    
+    def parse_here(self, to_parse, chunk):
+        """Parse and validate a chunk in this thread, as a finished future"""
+        future = Future()
+        future.set_result(process_subtitle_batch(to_parse, chunk))
+        return future
+    
+    def discard_pool(self):
+        """Stop using a parser pool that lost a worker, later chunks are parsed here"""
+        if self.pool:
+            logging.error("Parser process pool broke, parsing in the scan thread instead")
+            discard_parser_pool(self.pool)
+        self.pool = None
+        # Not created again for the rest of this scan
+        self.pool_failed = True
+    
+    def chunks(self, files):
+        """Group scanned files into chunks, cut short when the scan is slow"""
+        chunk = []
+        started = time.monotonic()
+        for file_path in files:
+            chunk.append(file_path)
+            if len(chunk) >= self.CHUNK_SIZE or time.monotonic() - started >= self.CHUNK_WAIT:
+                yield chunk
+                chunk = []
+                started = time.monotonic()
+        if chunk:
+            yield chunk
+    
+    def prepare_chunk(self, chunk):
+        """Drop known uploads and resolve what needs no guessit.
+        
+        Returns (chunk, cached, to_parse) where cached maps filenames parsed by
+        the fast path or found in the cache, to_parse lists the other files.
+        """
+        # Skip content that was uploaded before, even under another name
+        if self.dedup_index:
+            kept = [f for f in chunk if not self.dedup_index.is_uploaded(f)]
+            self.skipped_duplicates += len(chunk) - len(kept)
+            if self.scan_index and len(kept) < len(chunk):
+                self.scan_index.mark_done(set(chunk).difference(kept))
+            chunk = kept
+        
+        # Common release names are parsed right here by the fast path,
+        # known filenames come from the cache, only the rest go to guessit
+        cached = {}
+        unparsed = []
+        for file_path in chunk:
+            filename = os.path.basename(file_path)
+            file_info = fast_parse_filename(filename)
+            FAST_PATH_STATS.record(file_info is not None)
+            if file_info:
+                cached[filename] = self.cache_entry(file_info)
+            else:
+                unparsed.append(filename)
+        if self.parse_cache and unparsed:
+            cached.update(self.parse_cache.get_many(unparsed))
+        to_parse = [f for f in chunk if os.path.basename(f) not in cached]
+        return chunk, cached, to_parse
+    
+    def emit_chunk(self, size, chunk, future, cached):
+        """Report one parsed and validated chunk, in drop order, and the overall progress"""
+        parsed = {}
+        problems = {}
+        if future:
+            try:
+                results, problems = future.result()
+            except BrokenProcessPool:
+                self.discard_pool()
+                to_parse = [f for f in chunk if os.path.basename(f) not in cached]
+                results, problems = self.parse_here(to_parse, chunk).result()
+            parsed = {file_path: file_info for file_path, _, file_info in results}
+            if self.parse_cache:
+                self.parse_cache.put_many({
+                    os.path.basename(file_path): self.cache_entry(file_info)
+                    for file_path, file_info in parsed.items()
+                })
+        
+        batch = []
+        for file_path in chunk:
+            filename = os.path.basename(file_path)
+            if file_path in parsed:
+                file_info = parsed[file_path]
+            elif cached.get(filename):
+                file_info = dict(cached[filename], filename=filename)
+            else:
+                file_info = None
+            if file_info:
+                # Built here so resolving the path key stays off the GUI thread
+                record = QueueRecord(file_path, file_info['season'], file_info['episode'],
+                                     file_info['title'], file_info['filename'])
+                record.problem = problems.get(file_path)
+                self.invalid += record.problem is not None
+                self.detected_series.add(record.series)
+                batch.append(record)
+        
+        self.done += size
+        if self.scanning:
+            # The total is unknown until the scan ends, so the bar stays busy
+            self.progress.emit(f"Scanning... found {self.found} files, processed {self.done}", -1)
+        else:
+            self.progress.emit(f"Processed {self.done}/{self.found} files", int((self.done / self.found) * 100))
+        if batch:
+            self.files_processed.emit(batch)
+    
+    def cache_entry(self, file_info):
+        """What the parse cache keeps for a filename, None if it had no title"""
+        if not file_info:
+            return None
+        return {key: file_info[key] for key in ('season', 'episode', 'title')}
 
 class UploadThread(QThread):
     progress = pyqtSignal(int, str, str)  # (row, status, color)
-    finished = pyqtSignal(bool)  # True if all successful
     
-    def __init__(self, subdl, files_data, parent=None):
+    def __init__(self, subdl, files_data, workers=1, journal=None, dedup_index=None,
+                 skip_duplicates=True, season_packs=False, normalize_encoding=False,
+                 legacy_encoding=DEFAULT_LEGACY_ENCODING, scan_index=None, tmdb=None, parent=None):
         super().__init__(parent)
         self.subdl = subdl
         self.files_data = files_data
+        self.workers = max(1, workers)
+        self.journal = journal
+        self.dedup_index = dedup_index
+        self.skip_duplicates = skip_duplicates
+        self.season_packs = season_packs
+        self.normalize_encoding = normalize_encoding
+        self.legacy_encoding = legacy_encoding
+        # Uploaded files are left out of later incremental scans
+        self.scan_index = scan_index
+        # Season packs are checked against TMDB's episode counts
+        self.tmdb = tmdb
         self.is_paused = False
         self.is_cancelled = False
+        # True if all files were uploaded, read once the thread has finished
+        self.success = False
         
     def run(self):
-        success = True
-        for row, data in enumerate(self.files_data):
-            # Check if cancelled
-            if self.is_cancelled:
-                break
-                
-            # Handle pause
-            while self.is_paused and not self.is_cancelled:
-                QThread.msleep(100)
-            
-            # Emit progress - Processing
+        # Phases of different files overlap across the workers
+        pipeline = UploadPipeline(
+            self.subdl, self.workers, journal=self.journal,
+            dedup=self.dedup_index, skip_duplicates=self.skip_duplicates,
+            season_packs=self.season_packs, normalize_encoding=self.normalize_encoding,
+            legacy_encoding=self.legacy_encoding, tmdb=self.tmdb
+        )
+        self.success = pipeline.run(
+            self.files_data,
+            self.handle_pipeline_progress,
+            is_paused=lambda: self.is_paused,
+            is_cancelled=lambda: self.is_cancelled
+        )
+    
+    def handle_pipeline_progress(self, row, state, message):
+        """Translate pipeline states into table status text and colors"""
+        if self.scan_index and state in ('completed', 'skipped'):
+            self.scan_index.mark_done([self.files_data[row]['file_path']])
+        if state == 'processing':
             self.progress.emit(row, "Processing...", "#FFFDE7")
-            
-            try:
-                # Upload subtitle
-                upload_success = self.subdl.upload_subtitle(
-                    subtitle_file=data['file_path'],
-                    tmdb_id=data['tmdb_id'],
-                    season=data['season'],
-                    releases=data['releases'],
-                    language_id=data['language'],
-                    comment=data['comment'],
-                    framerate=data['framerate'],
-                    episode_from=data['episode'],
-                    episode_to=data['episode']
-                )
-                
-                if upload_success:
-                    self.progress.emit(row, "Completed ✓", "#E8F5E9")
-                else:
-                    self.progress.emit(row, "Failed ✗", "#FFEBEE")
-                    success = False
-                    break
-                    
-            except Exception as e:
-                self.progress.emit(row, f"Error: {str(e)}", "#FFEBEE")
-                success = False
-                break
-        
-        self.finished.emit(success)
+        elif state == 'uploading':
+            self.progress.emit(row, message, "#FFFDE7")
+        elif state == 'completed':
+            self.progress.emit(row, "Completed ✓", "#E8F5E9")
+        elif state == 'skipped':
+            self.progress.emit(row, f"{message} ✓", "#E8F5E9")
+        else:
+            self.progress.emit(row, f"Failed ✗ - {message}" if message else "Failed ✗", "#FFEBEE")
     
     def pause(self):
         self.is_paused = True
@@ -1368,15 +1983,3 @@ class UploadThread(QThread):
     
     def cancel(self):
         self.is_cancelled = True
-
-class SearchThread(QThread):
-        finished = pyqtSignal(list)  # Signal to emit search results
-
-        def __init__(self, tmdb_api, query):
-            super().__init__()
-            self.tmdb_api = tmdb_api
-            self.query = query
-
-        def run(self):
-            results = self.tmdb_api.search_tv_series(self.query)
-            self.finished.emit(results)
\ No newline at end of file